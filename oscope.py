@@ -38,33 +38,114 @@
 #
 #-------------------------------------------------------------------------------
 
-# For future Python3 compatibility:
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-
 import os
 import random
 import sys
 import argparse
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 PLOT = True
-if (PLOT):
+
+def _get_plt():
+    # Import matplotlib lazily so that startup of all the non-plotting
+    # actions (hardcopy, setup save/load, measurements, etc.) does not
+    # pay the considerable matplotlib import time. Only called when
+    # actually about to plot waveform data.
     try:
         import matplotlib.pyplot as plt
-    except:
+    except ImportError:
         print('matplotlib.pyplot is needed for plotting waveform data to screen')
         print('(very convenient). Please install it with "pip install matplotlib".\n')
         print('If you do not want to install this very useful Python')
         print('package, then change line "PLOT = True" to "PLOT = False" in')
         print('the file "oscope.py"')
         sys.exit(-1)
-    
-    
+    return plt
+
+def _plotWaveform(x, y, header):
+    # Plot the waveform plus a histogram of its values and block until
+    # the window is closed. Prefer pyqtgraph, which renders long
+    # traces much faster than matplotlib, but fall back to matplotlib
+    # if pyqtgraph is not installed.
+    try:
+        import pyqtgraph as pg
+    except ImportError:
+        pg = None
+
+    if (pg is not None):
+        import numpy as np
+
+        pg.mkQApp()
+        win = pg.GraphicsLayoutWidget(show=True, title='Waveform Data')
+
+        p1 = win.addPlot(title='Waveform Data')
+        p1.plot(x, y, pen='y')
+        p1.addLine(x=0.0, pen=pg.mkPen('r', style=pg.QtCore.Qt.PenStyle.DashLine))
+        p1.addLine(y=0.0, pen=pg.mkPen('r', style=pg.QtCore.Qt.PenStyle.DashLine))
+        p1.setLabel('bottom', header[0])
+        p1.setLabel('left', header[1])
+
+        p2 = win.addPlot(title='Histogram of Waveform Data')
+        counts, edges = np.histogram(y, bins=250)
+        p2.plot(edges, counts, stepMode='center', fillLevel=0, brush=(0,0,255,150))
+
+        pg.exec()
+    else:
+        plt = _get_plt()
+
+        fig, (ax1, ax2) = plt.subplots(1, 2)
+        ax1.plot(x, y)      # plot the data
+        ax1.axvline(x=0.0, color='r', linestyle='--')
+        ax1.axhline(y=0.0, color='r', linestyle='--')
+        ax1.set_title('Waveform Data')
+        ax1.set_xlabel(header[0])
+        ax1.set_ylabel(header[1])
+
+        # plot a histogram of the data
+        num_bins = 250
+        n, bins, patches = ax2.hist(y, num_bins)
+        ax2.set_title('Histogram of Waveform Data')
+
+        fig.tight_layout()
+        plt.show()
+
+
+
 from oscope_scpi import Oscilloscope
 
+# Measurements read out for each --measure channel, in display
+# order. A blank string inserts an extra blank line in the output.
+# Built once at module level instead of per channel inside main().
+MEASUREMENTS = ('Bit Rate',
+                'Burst Width',
+                'Counter Freq',
+                'Frequency',
+                'Period',
+                'Duty',
+                'Neg Duty',
+                '+ Width',
+                '- Width',
+                'Rise Time',
+                'Num Rising',
+                'Num Pos Pulses',
+                'Fall Time',
+                'Num Falling',
+                'Num Neg Pulses',
+                'Overshoot',
+                'Preshoot',
+                '',
+                'Amplitude',
+                'Pk-Pk',
+                'Top',
+                'Base',
+                'Maximum',
+                'Minimum',
+                'Average - Full Screen',
+                'RMS - Full Screen',
+                )
+
 def handleFilename(fname, ext, unique=True, timestamp=True):
 
     # If extension exists in fname, strip it and add it back later
@@ -90,9 +171,16 @@ def handleFilename(fname, ext, unique=True, timestamp=True):
 
     suffix = ''
     if (unique):
-        # If given filename exists, try to find a unique one
+        # If given filename exists, try to find a unique one. List the
+        # directory once and check candidates against that set instead
+        # of hitting the filesystem with a stat() per candidate.
+        try:
+            existing = {entry.name for entry in os.scandir(pn)}
+        except FileNotFoundError:
+            existing = set()
+        base = fn[len(pn)+1:]               # filename part of fn, without path
         num = 0
-        while(os.path.isfile(fn + suffix + ext)):
+        while((base + suffix + ext) in existing):
             num += 1
             suffix = "-{}".format(num)
 
@@ -100,36 +188,57 @@ def handleFilename(fname, ext, unique=True, timestamp=True):
 
     return fn
 
-def parse(scope):
+def parse(scope=None):
+
+    if (scope is not None):
+        chanAnaValidList = scope.chanAnaValidList
+        chanAllValidList = scope.chanAllValidList
+        series = scope.series
+    else:
+        # No instrument connected (fast help path) so advertise the
+        # superset of channel names instead of asking the scope
+        chanAnaValidList = [str(x) for x in range(1,5)]
+        chanAllValidList = chanAnaValidList + ['POD1', 'POD2']
+        series = None
+
+    # Render the channel lists for help text once instead of once per
+    # option that mentions them
+    chanAllChoicesStr = str(chanAllValidList).strip('[]')
+    chanAnaChoicesStr = str(chanAnaValidList).strip('[]')
+    annoColorChoices = ['ch'+str(x) for x in chanAnaValidList] + ['dig', 'math', 'ref', 'marker', 'white', 'red']
 
     parser = argparse.ArgumentParser(description='Access Agilent/KeySight MSO3034A scope')
     parser.add_argument('--hardcopy', '-y', metavar='outfile.png', help='grab hardcopy of scope screen and output to named file as a PNG image')
     parser.add_argument('--waveform', '-w', nargs=2, metavar=('channel', 'outfile.npz'), action='append',
-                        help='grab waveform data of channel ('+ str(scope.chanAllValidList).strip('[]') + ') and output to named file as a Numpy NPZ file (see oscopeplot.py or oscopecsv.py)')
+                        help='grab waveform data of channel ('+ chanAllChoicesStr + ') and output to named file as a Numpy NPZ file (see oscopeplot.py or oscopecsv.py)')
+    parser.add_argument('--waveform_dtype', metavar='dtype', choices=['float64', 'float32', 'float16'],
+                        help='save waveform y data as the given numpy dtype - float32/float16 shrink the file at the cost of precision (default: keep full precision)')
+    parser.add_argument('--compress', '-z', action='store_true',
+                        help='compress waveform NPZ files - smaller files but slower to write')
     parser.add_argument('--setup_save', '-s', metavar='outfile.stp', help='save the current setup of the oscilloscope into the named file')
     parser.add_argument('--setup_load', '-l', metavar='infile.stp', help='load the current setup of the oscilloscope from the named file')
     parser.add_argument('--statistics', '-t', action='store_true', help='dump to the output the current displayed measurements')
-    parser.add_argument('--autoscale', '-u',  nargs='?', action='append', choices=scope.chanAllValidList,
+    parser.add_argument('--autoscale', '-u',  nargs='?', action='append', choices=chanAllValidList,
                             help='cause selected channel to get displayed and autoscaled. Can issue multiples of this option. Leave arg blank to autoscale displayed channels.')
 
-    if (scope.series == 'KEYSIGHT' or scope.series == 'UXR'):
+    if (series == 'KEYSIGHT' or series == 'UXR'):
         # generic KEYSIGHT series and UXR series do not support DVM,
         # but still need to be able to check args.dvm, so suppress dvm
         # from help() and if someone tries to use it, force to None to
         # prevent its use.
         parser.add_argument('--dvm', '-d', action='store_const', const=None, help=argparse.SUPPRESS)
     else:
-        parser.add_argument('--dvm', '-d', nargs=1, action='append', choices=scope.chanAnaValidList,
+        parser.add_argument('--dvm', '-d', nargs=1, action='append', choices=chanAnaValidList,
                                 help='measure and output the DVM readings of selected channel')
 
-    parser.add_argument('--measure', '-m', nargs=1, action='append', choices=scope.chanAnaValidList,
+    parser.add_argument('--measure', '-m', nargs=1, action='append', choices=chanAnaValidList,
                             help='measure and output the selected channel')
     parser.add_argument('--annotate', '-a', nargs='?', metavar='text', const=' ', help='Add annotation text to screen. Clear text if label is blank')
-    parser.add_argument('--annocolor', '-c', nargs=1, metavar='color', 
-                            choices=['ch'+str(x) for x in scope.chanAnaValidList] + ['dig', 'math', 'ref', 'marker', 'white', 'red'],
+    parser.add_argument('--annocolor', '-c', nargs=1, metavar='color',
+                            choices=annoColorChoices,
                             help='Set the annotation color to use. Valid values: %(choices)s')
-    parser.add_argument('--label', '-b',  nargs=2, action='append', metavar=('channel', 'label'), 
-                            help='Change label of selected channel (' + str(scope.chanAnaValidList).strip('[]') + ')')
+    parser.add_argument('--label', '-b',  nargs=2, action='append', metavar=('channel', 'label'),
+                            help='Change label of selected channel (' + chanAnaChoicesStr + ')')
 
     # Print help if no options are given on the command line
     if (len(sys.argv) <= 1):
@@ -158,75 +267,100 @@ def main():
     #@@@#agilent_msox_3034a = os.environ.get('MSOX3000_IP', 'TCPIP0::172.16.2.13::INSTR')
     #@@@#agilent_mxr_058a = os.environ.get('MXR058A_IP', 'TCPIP0::172.16.2.13::INSTR')
     pyvisa_oscope = os.environ.get('OSCOPE_IP', 'TCPIP0::172.16.2.13::INSTR')
-    
+
+    # Handle --help and the no-argument case before connecting to the
+    # oscilloscope - parse() prints usage and exits for these, so no
+    # need to pay for a VISA session (or time out if the scope is
+    # unreachable) just to show help text.
+    if (len(sys.argv) <= 1 or '-h' in sys.argv or '--help' in sys.argv):
+        parse()
+
     ## Connect to the Oscilloscope
     scope = Oscilloscope(pyvisa_oscope)
 
-    ## Help to use with other models. Likely will not need these three
-    ## lines once get IDN strings from all know oscilloscopes that I
-    ## want to use
-    scope.open()
-    print('Potential SCPI Device: ' + scope.idn() + '\n')
-    scope.close()
-    
-    ## Upgrade Object to best match based on IDN string
+    ## Upgrade Object to best match based on IDN string.
+    ##
+    ## NOTE: getBestClass() does its own open/*IDN?/close probe
+    ## session, so no need for a separate one here just to print the
+    ## ID - that cost an extra VISA connection setup and teardown on
+    ## every run.
     scope = scope.getBestClass()
     
     ## Open this object and work with it
     scope.open()
     print('Using SCPI Device:     ' + scope.idn() + ' of series: ' + scope.series + '\n')
 
+    # Increase the PyVISA chunk size so that bulk transfers like
+    # waveform data, screen hardcopies and setup files move in a few
+    # large reads instead of being split into many small reads with
+    # the default 20 KB chunk size.
+    try:
+        scope._inst.chunk_size = 10 * 1024 * 1024
+    except AttributeError:
+        # if the underlying resource does not expose chunk_size,
+        # simply continue with its default
+        pass
+
     # parse command line options with knowledge of instrument
     args = parse(scope)
     
     if (args.dvm):
+        # Hoist the loop invariants: whether DVM was enabled at the
+        # start (a SCPI query per iteration otherwise), the over-range
+        # constant and whether this series supports DVM:FREQ?
+        #
+        # Save if DVM mode was enabled or not
+        # measureDVM functions will enable it if it is not already
+        dvmEnabledAtStart = scope.DVMisEnabled()
+        overRange = scope.OverRange
+        supportsFreq = (scope.series == "MSOX3" or scope.series == "DSOX3")
+
         for lst in args.dvm:
             try:
-                # Save if DVM mode was enabled or not
-                # measureDVM functions will enable it if it is not already
-                dvmEnabledAtStart = scope.DVMisEnabled()
-                
                 chan = lst[0]
-                acrms = scope.measureDVMacrms(chan)
-                dc = scope.measureDVMdc(chan)
-                dcrms = scope.measureDVMdcrms(chan)
-                if (scope.series == "MSOX3" or scope.series == "DSOX3"):
-                    # These series are the only ones know to support DVM:FREQ? command
-                    freq = scope.measureDVMfreq(chan)
-                else:
-                    freq = scope.OverRange
-                    
-                if (acrms >= scope.OverRange):
+                # Grab all DVM readings at once so the DVM enable
+                # check and source selection happen only once per
+                # channel instead of once per reading
+                readings = scope.measureDVMall(chan)
+                acrms = readings['ACRMS']
+                dc = readings['DC']
+                dcrms = readings['DCRMS']
+                freq = readings['FREQ']
+
+
+                if (acrms >= overRange):
                     acrms = 'INVALID '
-                if (dc >= scope.OverRange):
+                if (dc >= overRange):
                     dc = 'INVALID '
-                if (dcrms >= scope.OverRange):
+                if (dcrms >= overRange):
                     dcrms = 'INVALID '
-                if (freq >= scope.OverRange):
+                if (freq >= overRange):
                     freq = 'INVALID '
-            
+
                 print("Ch.{}: {: 7.5f}V ACRMS".format(chan,acrms))
                 print("Ch.{}: {: 7.5f}V DC".format(chan,dc))
                 print("Ch.{}: {: 7.5f}V DCRMS".format(chan,dcrms))
-                if (scope.series == "MSOX3" or scope.series == "DSOX3"):
+                if (supportsFreq):
                     # These series are the only ones know to support DVM:FREQ? command
                     print("Ch.{}: {}Hz FREQ".format(chan,freq))
 
-                # Turn off DVM mode if it was off to begin with
-                if (not dvmEnabledAtStart):
-                    scope.enableDVM(False)
-                
             except ValueError as exp:
                 print(exp)
+
+        # Turn off DVM mode if it was off to begin with
+        if (not dvmEnabledAtStart):
+            scope.enableDVM(False)
                 
     if (args.statistics):
         stats = scope.measureStatistics()
 
-        print('\nNOTE: If returned value is >= {}, then it is to be considered INVALID\n'.format(scope.OverRange))
-        print('{: ^24} {: ^12} {: ^12} {: ^12} {: ^12} {: ^12} {: ^12}'.format('Measure', 'Current', 'Mean', 'Min', 'Max', 'Std Dev', 'Count'))
+        # Build up the whole table and print it with a single call so
+        # the output is not interleaved with line-by-line I/O
+        lines = ['\nNOTE: If returned value is >= {}, then it is to be considered INVALID\n'.format(scope.OverRange),
+                 '{: ^24} {: ^12} {: ^12} {: ^12} {: ^12} {: ^12} {: ^12}'.format('Measure', 'Current', 'Mean', 'Min', 'Max', 'Std Dev', 'Count')]
         for stat in stats:
             measure = stat['label'].split('(')[0]   # pull out the measurement name from the label (which has a '(channel)' suffix)
-            print('{: <24} {:>12.6} {:>12.6} {:>12.6} {:>12.6} {:>12.6} {:>12}'.format(
+            lines.append('{: <24} {:>12.6} {:>12.6} {:>12.6} {:>12.6} {:>12.6} {:>12}'.format(
                 stat['label'],
                 scope.polish(stat['CURR'],measure),
                 scope.polish(stat['MIN'],measure),
@@ -235,7 +369,8 @@ def main():
                 scope.polish(stat['STDD'],measure),
                 stat['COUN']   # no units or polish needed here
                 ))
-        print()
+        lines.append('')
+        print('\n'.join(lines))
         
     if (args.measure):        
         for lst in args.measure:
@@ -245,43 +380,17 @@ def main():
                 print('\nNOTE: If returned value is >= {}, then it is to be considered INVALID'.format(scope.OverRange))
                 print('NOTE: Have not double-checked that these entities are correct, so user must double-check')
                 print('\nMeasurements for Ch. {}:'.format(chan))
-                measurements = ['Bit Rate',
-                                'Burst Width',
-                                'Counter Freq',
-                                'Frequency',
-                                'Period',
-                                'Duty',
-                                'Neg Duty',
-                                '+ Width',
-                                '- Width',
-                                'Rise Time',                            
-                                'Num Rising',
-                                'Num Pos Pulses',
-                                'Fall Time',
-                                'Num Falling',
-                                'Num Neg Pulses',
-                                'Overshoot',
-                                'Preshoot',
-                                '',
-                                'Amplitude',
-                                'Pk-Pk',
-                                'Top',
-                                'Base',
-                                'Maximum',
-                                'Minimum',
-                                'Average - Full Screen',
-                                'RMS - Full Screen',
-                ]
-                for meas in measurements:
+                for meas in MEASUREMENTS:
                     if (meas == ''):
                         # use a blank string to put in an extra line
                         print()
                     else:
-                        # using scope.measureTbl[] dictionary, call the
-                        # appropriate method to read the
+                        # using scope's _measureFuncs dictionary, call
+                        # the appropriate method to read the
                         # measurement. Also, using the same measurement
                         # name, pass it to the polish() method to format
-                        # the data with units and SI suffix.
+                        # the data with units (from _measureUnits) and
+                        # SI suffix.
                         print('{: <24} {:>12.6}'.format(meas,scope.polish(scope.measureTblCall(meas, chan), meas)))
 
             except ValueError as exp:
@@ -320,46 +429,65 @@ def main():
         print("Hardcopy Output file: {}".format(fn) )
 
     if (args.waveform):
-        for nxt in args.waveform:
-            try:
-                # check the channel
-                channel = nxt[0]
-                if (channel in scope.chanAllValidList):
-
-                    (x, y, header, meta) = scope.waveformData(channel)
-
-                    # Plot received data to screen so user can see what they got before saving the file.
-                    # However, if the lengths do not match, cannot plot. This can happen if channel is PODx and data are bits.
-                    if (PLOT and (len(x) == len(y))):
-                        print("Close the plot window to continue...")
-                        fig, (ax1, ax2) = plt.subplots(1, 2)
-                        ax1.plot(x, y)      # plot the data
-                        ax1.axvline(x=0.0, color='r', linestyle='--')
-                        ax1.axhline(y=0.0, color='r', linestyle='--')
-                        ax1.set_title('Waveform Data')
-                        ax1.set_xlabel(header[0])
-                        ax1.set_ylabel(header[1])
-            
-                        # plot a histogram of the data
-                        num_bins = 250
-                        n, bins, patches = ax2.hist(y, num_bins)
-                        ax2.set_title('Histogram of Waveform Data')
-            
-                        fig.tight_layout()
-                        plt.show()
-
-                    # Use NPZ files which write in under a second instead of bulky csv files
-                    if False:
-                        fn = handleFilename(nxt[1], 'csv')
-                        dataLen = scope.waveformSaveCSV(fn, x, y, header, meta)
+        # Use a single worker thread so the (potentially slow) file
+        # write overlaps the time the plot window is on screen and the
+        # SCPI download of the next requested channel, instead of
+        # starting only after the plot window is closed. All SCPI
+        # traffic stays on the main thread; only file writes are
+        # offloaded.
+        # frozenset gives O(1) membership checks for the channel
+        # validation in the loop below
+        validChannels = frozenset(scope.chanAllValidList)
+
+        pendingSaves = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for nxt in args.waveform:
+                try:
+                    # check the channel
+                    channel = nxt[0]
+                    if (channel in validChannels):
+
+                        (x, y, header, meta) = scope.waveformData(channel)
+
+                        # Start writing the file in the background before plotting.
+                        #
+                        # Use NPZ files which write in under a second instead of bulky csv files
+                        if False:
+                            fn = handleFilename(nxt[1], 'csv')
+                            saveFut = executor.submit(scope.waveformSaveCSV, fn, x, y, header, meta)
+                        else:
+                            fn = handleFilename(nxt[1], 'npz')
+                            saveFut = executor.submit(scope.waveformSaveNPZ, fn, x, y, header, meta,
+                                                      dtype=args.waveform_dtype, compress=args.compress)
+
+                        # Plot received data to screen so user can see what they got before saving the file.
+                        # However, if the lengths do not match, cannot plot. This can happen if channel is PODx and data are bits.
+                        if (PLOT and (len(x) == len(y))):
+                            print("Close the plot window to continue...")
+
+                            # Deep captures can be 100s of Mpts which
+                            # makes plotting crawl. The screen only
+                            # has a few thousand pixels across, so
+                            # stride-downsample to ~100k points for
+                            # display only; the file still gets every
+                            # point.
+                            step = max(1, len(y) // 100000)
+                            _plotWaveform(x[::step], y[::step], header)
+
+                        # Collect the outstanding save instead of
+                        # waiting on it here, so the next channel's
+                        # data download can start while this file is
+                        # still being written.
+                        pendingSaves.append((channel, fn, saveFut))
                     else:
-                        fn = handleFilename(nxt[1], 'npz')
-                        dataLen = scope.waveformSaveNPZ(fn, x, y, header, meta)
-                    print("Waveform Output of Channel {} in {} points to file {}".format(channel,dataLen,fn))
-                else:
-                    print('INVALID Channel Value: {}  SKIPPING!'.format(channel))
-            except ValueError as exp:
-                print(exp)
+                        print('INVALID Channel Value: {}  SKIPPING!'.format(channel))
+                except ValueError as exp:
+                    print(exp)
+
+            # Wait for all writes to finish and report them in order
+            for (channel, fn, saveFut) in pendingSaves:
+                dataLen = saveFut.result()
+                print("Waveform Output of Channel {} in {} points to file {}".format(channel,dataLen,fn))
                         
     if (args.setup_save):
         fn = handleFilename(args.setup_save, 'stp')
@@ -1,48 +1,52 @@
 
-# Standard SCPI commands
-from .scpi import SCPI
-
-# Common Oscillocope SCPI commands
-from .oscilloscope import Oscilloscope
-
-# Common Keysight Oscilloscope SCPI commands
-from .keysight import Keysight
-
-# Support of Keysight MXR-series oscilloscopes
-from .mxr import MXR
-
-# Support of Keysight MXRxx8A oscilloscope
-from .mxr import MXRxx8A
-
-# Support of Keysight MXRxx4A oscilloscope
-from .mxr import MXRxx4A
-
-# Support of Keysight UXR-series oscilloscopes
-from .uxr import UXR
-
-# Support of Keysight UXRxxx4A oscilloscope
-from .uxr import UXRxxx4A
-
-# Support of Keysight UXRxxx2A oscilloscope
-from .uxr import UXRxxx2A
-
-# Support of HP/Agilent/Keysight DSO-X oscilloscopes
-from .dso import DSOX
-
-# Support of HP/Agilent/Keysight DSO-X 3000A 2-channel oscilloscope
-from .dso import DSOX3xx2A
-
-# Support of HP/Agilent/Keysight DSO-X 3000A 4-channel oscilloscope
-from .dso import DSOX3xx4A
-
-# Support of HP/Agilent/Keysight MSO-X oscilloscopes
-from .dso import MSOX
-
-# Support of HP/Agilent/Keysight MSO-X 3000A 2-channel oscilloscope
-from .dso import MSOX3xx2A
-
-# Support of HP/Agilent/Keysight MSO-X 3000A 4-channel oscilloscope
-from .dso import MSOX3xx4A
-
-
-
+# Map each public name to the submodule that defines it. The classes
+# are imported lazily via PEP 562 module __getattr__ below, so
+# "import oscope_scpi" no longer pays for numpy/pyvisa/quantiphy and
+# every oscilloscope family up front - only the submodules actually
+# used get imported.
+_lazyImports = {
+    # Standard SCPI commands
+    'SCPI':       '.scpi',
+
+    # Common Oscillocope SCPI commands
+    'Oscilloscope': '.oscilloscope',
+
+    # Common Keysight Oscilloscope SCPI commands
+    'Keysight':   '.keysight',
+
+    # Support of Keysight MXR-series oscilloscopes
+    'MXR':        '.mxr',
+    'MXRxx8A':    '.mxr',
+    'MXRxx4A':    '.mxr',
+
+    # Support of Keysight UXR-series oscilloscopes
+    'UXR':        '.uxr',
+    'UXRxxx4A':   '.uxr',
+    'UXRxxx2A':   '.uxr',
+
+    # Support of HP/Agilent/Keysight DSO-X/MSO-X oscilloscopes
+    'DSOX':       '.dso',
+    'DSOX3xx2A':  '.dso',
+    'DSOX3xx4A':  '.dso',
+    'MSOX':       '.dso',
+    'MSOX3xx2A':  '.dso',
+    'MSOX3xx4A':  '.dso',
+}
+
+__all__ = list(_lazyImports)
+
+
+def __getattr__(name):
+    modName = _lazyImports.get(name)
+    if (modName is None):
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    from importlib import import_module
+    attr = getattr(import_module(modName, __name__), name)
+    # cache it so __getattr__ only runs once per name
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazyImports))
@@ -26,13 +26,11 @@
 #  Control of HP/Agilent/Keysight MSO-X/DSO-X 3000A Oscilloscope with PyVISA
 #-------------------------------------------------------------------------------
 
-# For future Python3 compatibility:
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-
 import sys
 import os
+import warnings
+
+import numpy as np
 
 try:
     from .keysight import Keysight
@@ -53,39 +51,81 @@ class DSOX(Keysight):
         super(DSOX, self).__init__(resource, maxChannel, wait)
 
         # Give the Series a name
-        self._series = 'DSOX'        
-        
-    def measureStatistics(self):
+        self._series = 'DSOX'
+
+        # statistics display has not been turned on yet
+        self._statsDisplayEnabled = False
+
+    def _invalidateCachedState(self):
+        super(DSOX, self)._invalidateCachedState()
+
+        # a reset or setup load may turn the statistics display back
+        # off, so re-enable it on next use
+        self._statsDisplayEnabled = False
+
+    def measureStatistics(self, asStruct=False):
         """Returns an array of dictionaries from the current statistics window.
 
         The definition of the returned dictionary can be easily gleaned
         from the code below.
+
+        asStruct - if True, return a numpy structured array with
+        fields label/CURR/MIN/MAX/MEAN/STDD/COUN instead of a list of
+        dictionaries. Much more compact with many measurements and
+        the columns can be used numerically without further
+        conversion, like stats['MEAN'].
         """
 
-        # turn on the statistics display - these are specific to MSOX/DSOX
-        self._instWrite("SYSTem:MENU MEASure")
-        self._instWrite("MEASure:STATistics:DISPlay ON")
+        # turn on the statistics display - these are specific to
+        # MSOX/DSOX. Both commands are idempotent, so chain them into a
+        # single write and only send it the first time; the two SCPI
+        # round-trips otherwise dominate the cost of polling statistics
+        # in a loop.
+        if (not self._statsDisplayEnabled):
+            self._instWrite("SYSTem:MENU MEASure;:MEASure:STATistics:DISPlay ON")
+            self._statsDisplayEnabled = True
 
         statFlat = super(DSOX, self)._measureStatistics()
-        
+
+        # bail out right away on an empty response so the parser below
+        # never runs when polling a scope with no measurements enabled
+        if (not statFlat or statFlat == ['']):
+            return []
+
         # convert the flat list into a two-dimentional matrix with seven columns per row
         cols = 7
         if ((len(statFlat) % cols != 0)):
-            print('Unexpected response. Oscilloscope may not have any measurements enabled.')
-            statMat = []
-        else:
-            statMat = [statFlat[i:i+cols] for i in range(0,len(statFlat),cols)]
-        
-        # convert each row into a dictionary, while converting text strings into numbers
+            # a warning instead of a print so callers polling in a loop
+            # can suppress or redirect it
+            warnings.warn('Unexpected response. Oscilloscope may not have any measurements enabled.')
+            return []
+
+        # Let numpy convert all the numeric strings in one pass
+        # instead of calling float() on every cell
+        statMat = np.array(statFlat).reshape(-1, cols)
+        numbers = statMat[:,1:].astype(np.float64)
+
+        if (asStruct):
+            stats = np.zeros(len(statMat), dtype=[('label', statMat.dtype),
+                                                  ('CURR', 'f8'), ('MIN', 'f8'),
+                                                  ('MAX', 'f8'), ('MEAN', 'f8'),
+                                                  ('STDD', 'f8'), ('COUN', 'i8')])
+            stats['label'] = statMat[:,0]
+            for (i, field) in enumerate(('CURR', 'MIN', 'MAX', 'MEAN', 'STDD')):
+                stats[field] = numbers[:,i]
+            stats['COUN'] = numbers[:,5].astype(np.int64)
+            return stats
+
+        # convert each row into a dictionary
         stats = []
-        for stat in statMat:
-            stats.append({'label':stat[0],
-                          'CURR':float(stat[1]),   # Current Value
-                          'MIN':float(stat[2]),    # Minimum Value
-                          'MAX':float(stat[3]),    # Maximum Value
-                          'MEAN':float(stat[4]),   # Average/Mean Value
-                          'STDD':float(stat[5]),   # Standard Deviation
-                          'COUN':int(stat[6])      # Count of measurements
+        for (label, num) in zip(statMat[:,0], numbers):
+            stats.append({'label':label,
+                          'CURR':num[0],     # Current Value
+                          'MIN':num[1],      # Minimum Value
+                          'MAX':num[2],      # Maximum Value
+                          'MEAN':num[3],     # Average/Mean Value
+                          'STDD':num[4],     # Standard Deviation
+                          'COUN':int(num[5]) # Count of measurements
                           })
 
         # return the result in an array of dictionaries
@@ -94,6 +134,11 @@ class DSOX(Keysight):
 class MSOX(DSOX):
     """Basic class for controlling and accessing a HP/Agilent/Keysight Generic MSO-X Oscilloscope"""
 
+    # Since MSO-X have digital channels, POD1 is for digital channels
+    # 0-7 and POD2 for digital channels 8-15. Built once at class-body
+    # time instead of a per-instance list comprehension.
+    _extraChannels = ('POD1', 'POD2')
+
     def __init__(self, resource, maxChannel=2, wait=0):
         """Init the class with the instruments resource string
 
@@ -103,33 +148,20 @@ class MSOX(DSOX):
         """
         super(MSOX, self).__init__(resource, maxChannel, wait)
 
-        # Since MSO-X have digital channels, add POD1 is for digital
-        # channels 0-7 or POD2 for digital channels 8-15
-        self._chanAllValidList += ['POD'+str(x) for x in range(1,3)]
+        # add the digital channel PODs to the valid channel list
+        self._chanAllValidList += self._extraChannels
 
         # Give the Series a name
         self._series = 'MSOX'
         
-class DSOX3xx2A(DSOX):
-    """Basic class for controlling and accessing a HP/Agilent/Keysight DSO-X 3xx2A 2-Channel Oscilloscope"""
-
-    maxChannel = 2
-
-    def __init__(self, resource, wait=0):
-        """Init the class with the instruments resource string
-
-        resource   - resource string or VISA descriptor, like TCPIP0::172.16.2.13::INSTR
-        wait       - float that gives the default number of seconds to wait after sending each command
-        """
-        super(DSOX3xx2A, self).__init__(resource, maxChannel=DSOX3xx2A.maxChannel, wait=wait)
-
-        # Give the Series a name
-        self._series = 'DSOX3'
-        
-class MSOX3xx2A(MSOX):
-    """Basic class for controlling and accessing a HP/Agilent/Keysight MSO-X 3xx2A 2-Channel Oscilloscope"""
+def _makeModel(name, base, maxChannel, series, versionLegacy=None):
+    """Build one of the model-specific child classes.
 
-    maxChannel = 2
+    The eight DSOX3/MSOX3 variants differ only in base class, channel
+    count, series name and (for the T models) the legacy version
+    threshold, so generate them from a table instead of repeating the
+    same boilerplate class eight times.
+    """
 
     def __init__(self, resource, wait=0):
         """Init the class with the instruments resource string
@@ -137,130 +169,39 @@ class MSOX3xx2A(MSOX):
         resource   - resource string or VISA descriptor, like TCPIP0::172.16.2.13::INSTR
         wait       - float that gives the default number of seconds to wait after sending each command
         """
-        super(MSOX3xx2A, self).__init__(resource, maxChannel=MSOX3xx2A.maxChannel, wait=wait)
+        base.__init__(self, resource, maxChannel=maxChannel, wait=wait)
 
         # Give the Series a name
-        self._series = 'MSOX3'
-
-class DSOX3xx4A(DSOX):
-    """Basic class for controlling and accessing a HP/Agilent/Keysight DSO-X 3xx4A 4-Channel Oscilloscope"""
-
-    maxChannel = 4
-
-    def __init__(self, resource, wait=0):
-        """Init the class with the instruments resource string
+        self._series = series
 
-        resource   - resource string or VISA descriptor, like TCPIP0::172.16.2.13::INSTR
-        wait       - float that gives the default number of seconds to wait after sending each command
-        """
-        super(DSOX3xx4A, self).__init__(resource, maxChannel=DSOX3xx4A.maxChannel, wait=wait)
-
-        # Give the Series a name
-        self._series = 'DSOX3'
-        
-class MSOX3xx4A(MSOX):
-    """Basic class for controlling and accessing a HP/Agilent/Keysight MSO-X 3xx4A 4-Channel Oscilloscope"""
+        if (versionLegacy is not None):
+            # This appears to use Legacy commands although it has a rather
+            # high firmware version number, so set _versionLegacy high
+            # enough
+            self._versionLegacy = versionLegacy
 
-    maxChannel = 4
+    doc = ('Basic class for controlling and accessing a HP/Agilent/Keysight '
+           '{}-X 3{}{} {}-Channel Oscilloscope'.format(name[:3], 'xx'+name[7], name[8],
+                                                       maxChannel))
+    return type(name, (base,), {'__doc__': doc,
+                                'maxChannel': maxChannel,
+                                '__init__': __init__})
 
-    def __init__(self, resource, wait=0):
-        """Init the class with the instruments resource string
-
-        resource   - resource string or VISA descriptor, like TCPIP0::172.16.2.13::INSTR
-        wait       - float that gives the default number of seconds to wait after sending each command
-        """
-        super(MSOX3xx4A, self).__init__(resource, maxChannel=MSOX3xx4A.maxChannel, wait=wait)
-        
-        # Give the Series a name
-        self._series = 'MSOX3'
-
-                
 #######################################################################
 # Not completely sure how compatible the T suffix is with the A suffix
 # but assume that the commands we are using are compatible and use the
 # same series name.
+#
+# The T models appear to use Legacy commands although they have rather
+# high firmware version numbers, so their _versionLegacy is set high
+# enough.
 #######################################################################
-class DSOX3xx2T(DSOX):
-    """Basic class for controlling and accessing a HP/Agilent/Keysight DSO-X 3xx2T 2-Channel Oscilloscope"""
-
-    maxChannel = 2
+DSOX3xx2A = _makeModel('DSOX3xx2A', DSOX, 2, 'DSOX3')
+MSOX3xx2A = _makeModel('MSOX3xx2A', MSOX, 2, 'MSOX3')
+DSOX3xx4A = _makeModel('DSOX3xx4A', DSOX, 4, 'DSOX3')
+MSOX3xx4A = _makeModel('MSOX3xx4A', MSOX, 4, 'MSOX3')
+DSOX3xx2T = _makeModel('DSOX3xx2T', DSOX, 2, 'DSOX3T', versionLegacy=9.999)
+MSOX3xx2T = _makeModel('MSOX3xx2T', MSOX, 2, 'MSOX3T', versionLegacy=9.999)
+DSOX3xx4T = _makeModel('DSOX3xx4T', DSOX, 4, 'DSOX3T', versionLegacy=9.999)
+MSOX3xx4T = _makeModel('MSOX3xx4T', MSOX, 4, 'MSOX3T', versionLegacy=9.999)
 
-    def __init__(self, resource, wait=0):
-        """Init the class with the instruments resource string
-
-        resource   - resource string or VISA descriptor, like TCPIP0::172.16.2.13::INSTR
-        wait       - float that gives the default number of seconds to wait after sending each command
-        """
-        super(DSOX3xx2T, self).__init__(resource, maxChannel=DSOX3xx2T.maxChannel, wait=wait)
-
-        # Give the Series a name
-        self._series = 'DSOX3T'
-
-        # This appears to use Legacy commands although it has a rather
-        # high firmware version number, so set _versionLegacy high
-        # enough
-        self._versionLegacy = 9.999
-        
-class MSOX3xx2T(MSOX):
-    """Basic class for controlling and accessing a HP/Agilent/Keysight MSO-X 3xx2T 2-Channel Oscilloscope"""
-
-    maxChannel = 2
-
-    def __init__(self, resource, wait=0):
-        """Init the class with the instruments resource string
-
-        resource   - resource string or VISA descriptor, like TCPIP0::172.16.2.13::INSTR
-        wait       - float that gives the default number of seconds to wait after sending each command
-        """
-        super(MSOX3xx2T, self).__init__(resource, maxChannel=MSOX3xx2T.maxChannel, wait=wait)
-
-        # Give the Series a name
-        self._series = 'MSOX3T'
-
-        # This appears to use Legacy commands although it has a rather
-        # high firmware version number, so set _versionLegacy high
-        # enough
-        self._versionLegacy = 9.999
-        
-class DSOX3xx4T(DSOX):
-    """Basic class for controlling and accessing a HP/Agilent/Keysight DSO-X 3xx4T 4-Channel Oscilloscope"""
-
-    maxChannel = 4
-
-    def __init__(self, resource, wait=0):
-        """Init the class with the instruments resource string
-
-        resource   - resource string or VISA descriptor, like TCPIP0::172.16.2.13::INSTR
-        wait       - float that gives the default number of seconds to wait after sending each command
-        """
-        super(DSOX3xx4T, self).__init__(resource, maxChannel=DSOX3xx4T.maxChannel, wait=wait)
-
-        # Give the Series a name
-        self._series = 'DSOX3T'
-        
-        # This appears to use Legacy commands although it has a rather
-        # high firmware version number, so set _versionLegacy high
-        # enough
-        self._versionLegacy = 9.999
-        
-class MSOX3xx4T(MSOX):
-    """Basic class for controlling and accessing a HP/Agilent/Keysight MSO-X 3xx4T 4-Channel Oscilloscope"""
-
-    maxChannel = 4
-
-    def __init__(self, resource, wait=0):
-        """Init the class with the instruments resource string
-
-        resource   - resource string or VISA descriptor, like TCPIP0::172.16.2.13::INSTR
-        wait       - float that gives the default number of seconds to wait after sending each command
-        """
-        super(MSOX3xx4T, self).__init__(resource, maxChannel=MSOX3xx4T.maxChannel, wait=wait)
-        
-        # Give the Series a name
-        self._series = 'MSOX3T'
-    
-        # This appears to use Legacy commands although it has a rather
-        # high firmware version number, so set _versionLegacy high
-        # enough
-        self._versionLegacy = 9.999
-        
@@ -26,11 +26,6 @@
 #  Control of Keysight EXR series Oscilloscopes with PyVISA
 #-------------------------------------------------------------------------------
 
-# For future Python3 compatibility:
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-
 import sys
 import os
 
@@ -40,12 +35,6 @@ except Exception:
     sys.path.append(os.getcwd())
     from mxr import MXR
 
-from time import sleep
-from datetime import datetime
-from quantiphy import Quantity
-from sys import version_info
-import pyvisa as visa
-
 class EXR(MXR):
     """Basic class for controlling and accessing a Keysight EXR Series Oscilloscope
 
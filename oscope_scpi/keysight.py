@@ -26,25 +26,144 @@
 #  HP/Agilent/Keysight specific SCPI commands
 #-------------------------------------------------------------------------------
 
-# For future Python3 compatibility:
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-
 import sys
 import os
 
 try:
     from .oscilloscope import Oscilloscope
+    from . import _fast
 except Exception:
     sys.path.append(os.getcwd())
     from oscilloscope import Oscilloscope
-    
-from time import sleep
-from datetime import datetime
-from sys import version_info
+    import _fast
+
+from time import sleep, monotonic
+import asyncio
 import numpy as np
-import struct
+
+## Lookup tables used to decode the numeric fields of the new-style
+## WAVeform:PREamble? response. The codes are small contiguous ints, so
+## tuples (with None filling the unused codes) indexed directly beat
+## dict literals that would otherwise be rebuilt and hashed on every
+## waveform fetch.
+_WAV_FORM = ("ASCii", "BYTE", "WORD", "LONG", "LONGLONG", "FLOat")
+_ACQ_TYPE = (None, "RAW", "AVERage", "VHIStogram", "HHIStogram", None,
+             "INTerpolate", None, None, "DIGITAL", "PDETect")
+_ACQ_MODE = ("RTIMe", "ETIMe", "SEGMented", "PDETect")
+_COUPLING = ("AC", "DC", "DCFIFTY", "LFREJECT")
+_UNITS        = ("UNKNOWN", "VOLT", "SECOND", "CONSTANT", "AMP", "DECIBEL", "HERTZ", "WATT")
+_UNITS_ABBREV = ("?", "V", "s", "CONST.", "A", "dB", "Hz", "W")
+_UNITS_AXIS   = ("UNKNOWN", "Voltage", "Time", "CONSTANT", "Current", "Decibels", "Frequency", "Power")
+
+## Fixed analog waveform header for the legacy download path
+_ANALOG_HEADER = ('Time (s)', 'Voltage (V)')
+
+## Lookup table mapping every 16-bit sample value to its 16 bits (bit 0
+## first), used by _unpackPodBits() for 16-bit POD data. At 64Ki x 16 =
+## 1 MiB it fits in L2 but is not free, so it is built lazily on first
+## use via _bitLUT16().
+_BIT_LUT16 = None
+
+def _bitLUT16():
+    """Return the 65536x16 bit lookup table, building it on first call."""
+    global _BIT_LUT16
+    if (_BIT_LUT16 is None):
+        _BIT_LUT16 = np.unpackbits(np.arange(65536, dtype='<u2').view(np.uint8).reshape(-1, 2),
+                                   axis=1, bitorder='little')
+    return _BIT_LUT16
+
+## Use to convert legacy color names - at module scope so lookups skip
+## the class-dict indirection on the annotation hot path
+_colorNameOldtoNew = {
+    'ch1':    'CHAN1',
+    'ch2':    'CHAN2',
+    'ch3':    'CHAN3',
+    'ch4':    'CHAN4',
+    'ch5':    'CHAN5',
+    'ch6':    'CHAN6',
+    'ch7':    'CHAN7',
+    'ch8':    'CHAN8',
+    'dig':    'DCH',
+    'math':   'FUNC1',
+    'ref':    'WMEM',
+    'marker': 'MARK',
+    'white':  'FUNC14',         # closest match
+    'red':    'FUNC12'          # no good match
+}
+
+def _unpackPodBits(values, bits, typ, out=None):
+    """Split packed digital POD samples into per-bit rows.
+
+    Returns a 2D array where row 0 is the sample array of bit 0 (D0),
+    row 1 is bit 1, etc. Views each sample as its little-endian bytes
+    and lets np.unpackbits split them - one C-level pass instead of a
+    Python loop creating a shifted copy per bit. bitorder='little'
+    puts bit 0 first so row order is D0, D1, ...
+
+    out - optional preallocated (bits, len(values)) destination, only
+    used by the numba path; the numpy path allocates its own result.
+    """
+    if (_fast.HAVE_NUMBA):
+        # one threaded native pass straight into the output array
+        if (out is None):
+            out = np.empty((bits, values.size), typ)
+        _fast.unpackPodBits(values, bits, out)
+        return out
+
+    nBytes = bits // 8
+    if (nBytes == 1):
+        # Single byte per sample - unpack the uint8 view directly. The
+        # unpacked 0/1 bytes already are the result, so when typ is a
+        # one-byte type just relabel the buffer instead of copying it.
+        u8 = values.view(np.uint8).reshape(-1, 1)
+        unpacked = np.unpackbits(u8, axis=1, bitorder='little').T
+        if (np.dtype(typ).itemsize == 1):
+            return unpacked.view(typ)
+        return unpacked.astype(typ)
+
+    if (nBytes == 2):
+        # 16-bit samples - a single gather through the precomputed bit
+        # table replaces the byte view plus unpackbits pass. The cast
+        # to unsigned is free for same-width data and keeps negative
+        # sample codes from indexing backwards.
+        lut = _bitLUT16()
+        return lut[values.astype('<u2', copy=False)][:, :bits].T.astype(typ)
+
+    # copy=False makes the cast free when the samples already arrive as
+    # little-endian unsigned data of the right width
+    u8 = values.astype('<u{}'.format(nBytes), copy=False).view(np.uint8).reshape(-1, nBytes)
+    return np.unpackbits(u8, axis=1, bitorder='little').T.astype(typ)
+
+## Parameter documentation shared by every simple measurement method -
+## appended to each generated docstring by _makeMeasure()
+_MEASURE_DOC_COMMON = """
+
+        If the returned value is >= self.OverRange, then no valid value
+        could be measured.
+
+        channel: channel, as string, to be measured - default channel
+        for future readings
+
+        wait - if not None, number of seconds to wait before querying measurement
+
+        install - if True, adds measurement to the statistics display
+        """
+
+def _makeMeasure(name, mode, para, doc):
+    """Build a measureXxx() method for a simple measurement.
+
+    Most of the measurement wrappers differ only in their SCPI mode,
+    optional parameters and description, so they are generated from
+    this one body instead of keeping ~18 identical copies in the class
+    - the mode strings stay data (mirrored in _measureSpecs for
+    batching) and the class dict stays small.
+    """
+    def measure(self, channel=None, wait=0.25, install=False):
+        return self._measure(mode, para=para, channel=channel, wait=wait, install=install)
+    measure.__name__ = name
+    measure.__qualname__ = 'Keysight.' + name
+    measure.__doc__ = doc.rstrip() + _MEASURE_DOC_COMMON
+    return measure
 
 class Keysight(Oscilloscope):
     """Child class of Oscilloscope for controlling and accessing a HP/Agilent/Keysight Oscilloscope with PyVISA and SCPI commands"""
@@ -92,24 +211,60 @@ class Keysight(Oscilloscope):
         # This will store annotation text if that feature is used
         self._annotationText = ''
         self._annotationColor = 'ch1' # default to Channel 1 color
+        self._bookmarkPosSet = False  # bookmark position not sent to scope yet
+        self._bookmarkCmdCache = {}   # rendered bookmark commands keyed on (text, color)
+
+        # Last WAVeform setup command sent by _waveformDataNew, or None
+        # if unknown - lets repeat fetches skip the setup write
+        self._waveState = None
+
+        # Last channel selected as the MEASure/DVM source, or None if
+        # unknown - lets repeat measurements on the same channel skip
+        # the SOURce? query round-trip
+        self._lastMeasSrc = None
+        self._lastDvmSrc = None
+
+        # memoized digital waveform headers keyed on (pod, bits) - see
+        # _podHeader()
+        self._podHeaderCache = {}
+
+        # persistent digital decode buffer - see _unpackPod()
+        self._digBuf = None
+
+        # cached DVM enable state, or None if unknown - see _setupDVM()
+        self._dvmEnabled = None
+
+        # Set to True to have the waveform download methods print their
+        # meta data to stdout - formatting and printing ~26 lines per
+        # fetch is pure overhead in sweep loops, so it is off by default
+        self._debug = False
+
+        # Seconds to wait before RUN/STOP/SINGLE mode switches. Found
+        # that with UXR it helped to wait a little to make sure the
+        # mode switch happens, so the UXR class overrides this; other
+        # models do not need the dead time.
+        self._modeSettleWait = 0
 
 
     def modeRun(self):
         """ Set Oscilloscope to RUN Mode """
-        # found that with UXR it helped to wait a little to make sure mode switch happens
-        sleep(0.1)
+        self._waveState = None  # new acquisitions may invalidate waveform setup
+        if (self._modeSettleWait > 0):
+            sleep(self._modeSettleWait)
         self._instWrite('RUN')
 
     def modeStop(self):
         """ Set Oscilloscope to STOP Mode """
-        # found that with UXR it helped to wait a little to make sure mode switch happens
-        sleep(0.1)
+        self._waveState = None  # new acquisitions may invalidate waveform setup
+        if (self._modeSettleWait > 0):
+            sleep(self._modeSettleWait)
         self._instWrite('STOP')
 
     def modeSingle(self):
         """ Set Oscilloscope to SINGLE Mode """
-        # found that with UXR it helped to wait a little to make sure mode switch happens
-        sleep(0.1)
+        self._waveState = None  # new acquisitions may invalidate waveform setup
+        if (self._modeSettleWait > 0):
+            sleep(self._modeSettleWait)
         self._instWrite('SINGLE')
 
         
@@ -126,36 +281,24 @@ class Keysight(Oscilloscope):
         # Save annotation text because may need it if change color
         self._annotationText = text
 
-        # Next, if <= self._versionLegacy, set color first. if > self._versionLegacy,
-        # annotateColor() also displays the annotation. Also handles
-        # case of color is None.
-        self.annotateColor(color)
-        
-        if (self._version <= self._versionLegacy):
+        if (self._version > self._versionLegacy):
+            # annotateColor() also displays the annotation. Also
+            # handles case of color is None.
+            self.annotateColor(color)
+        else:
             # Legacy commands for annotations
             #
-            # Add an annotation to the screen
-            self._instWrite("DISPlay:ANN:BACKground {}".format(background))   # transparent background - can also be OPAQue or INVerted
-            self._instWrite('DISPlay:ANN:TEXT "{}"'.format(text))
-            self._instWrite("DISPlay:ANN ON")
-            
-    ## Use to convert legacy color names
-    _colorNameOldtoNew = {
-        'ch1':    'CHAN1',
-        'ch2':    'CHAN2',
-        'ch3':    'CHAN3',
-        'ch4':    'CHAN4',
-        'ch5':    'CHAN5',
-        'ch6':    'CHAN6',
-        'ch7':    'CHAN7',
-        'ch8':    'CHAN8',
-        'dig':    'DCH',
-        'math':   'FUNC1',
-        'ref':    'WMEM',
-        'marker': 'MARK',
-        'white':  'FUNC14',         # closest match
-        'red':    'FUNC12'          # no good match
-    }
+            # Add an annotation to the screen. Chain the color (if
+            # given), background and text settings and the final ON
+            # into a single compound write, so the whole update costs
+            # one round-trip instead of four. Plain ';' keeps the
+            # DISPlay:ANN path context; ';:' resets the tree for the
+            # final DISPlay:ANN ON.
+            if (color is not None):
+                cmd = 'DISPlay:ANN:COLor {};BACKground {};TEXT "{}";:DISPlay:ANN ON'.format(color, background, text)
+            else:
+                cmd = 'DISPlay:ANN:BACKground {};TEXT "{}";:DISPlay:ANN ON'.format(background, text)
+            self._instWrite(cmd)
             
     def annotateColor(self, color):
         """ Change screen annotation color """
@@ -172,18 +315,31 @@ class Keysight(Oscilloscope):
                 # save color
                 self._annotationColor = color
 
-            # Place Bookmark in top left of grid
-            self._instWrite("DISPlay:BOOKmark1:XPOSition 0.015")
-            self._instWrite("DISPlay:BOOKmark1:YPOSition 0.06")
+            # Place Bookmark in top left of grid. The position is a
+            # sticky setting, so chain both coordinates into one write
+            # and only send them the first time instead of paying two
+            # round-trips on every annotation update.
+            if (not self._bookmarkPosSet):
+                self._instWrite("DISPlay:BOOKmark1:XPOSition 0.015;YPOSition 0.06")
+                self._bookmarkPosSet = True
 
             #@@@#print("Current Location of Bookmark 1: {},{}".format(
             #@@@#    self._instQuery("DISPlay:BOOKmark1:XPOSition?"), self._instQuery("DISPlay:BOOKmark1:YPOSition?")))
             
             # Always use the first Bookmark to implement similar annotation to 3000 series
-            self._instWrite('DISPlay:BOOKmark1:SET NONE,\"{}\",{},\"{}\"'.format(
-                self._annotationText,
-                self._colorNameOldtoNew[self._annotationColor],
-                self._annotationText))
+            #
+            # Cache the rendered command keyed on (text, color) so
+            # scripts that re-post the same annotation skip the string
+            # formatting each time.
+            key = (self._annotationText, self._annotationColor)
+            cmd = self._bookmarkCmdCache.get(key)
+            if (cmd is None):
+                cmd = 'DISPlay:BOOKmark1:SET NONE,\"{}\",{},\"{}\"'.format(
+                    self._annotationText,
+                    _colorNameOldtoNew[self._annotationColor],
+                    self._annotationText)
+                self._bookmarkCmdCache[key] = cmd
+            self._instWrite(cmd)
             
         elif (color is not None):
             # If legacy and color is None, ignore
@@ -198,27 +354,52 @@ class Keysight(Oscilloscope):
             self._instWrite("DISPlay:ANN OFF")
         
 
-    def channelLabel(self, label, channel=None):
-        """ Add a label to selected channel (or default one if None)
+    def _setScalarChannel(self, channel, ctx, validList=None):
+        """Normalize and validate channel for single-channel commands.
 
-            label - text of label
+        Every single-channel method shared the same preamble - make a
+        passed-in channel the current one, reject lists, check
+        validity - so it lives here instead of a copy per method.
+
+        channel - channel to make current, or None to keep the current one
+
+        ctx - short command name used in error messages, like 'MEASURE'
+
+        validList - collection of valid channel names; the analog
+        channel list if None
+
+        Returns the effective channel.
         """
 
         # If a channel value is passed in, make it the
         # current channel
-        if channel is not None and type(channel) is not list:
+        chanIsList = isinstance(channel, list)
+        if (channel is not None and not chanIsList):
             self.channel = channel
 
         # Make sure channel is NOT a list
-        if type(self.channel) is list or type(channel) is list:
-            raise ValueError('Channel cannot be a list for CHANNEL LABEL!')
+        if (chanIsList or isinstance(self.channel, list)):
+            raise ValueError('Channel cannot be a list for {}!'.format(ctx))
 
         # Check channel value
-        if (self.channel not in self._chanAnaValidList):
-            raise ValueError('INVALID Channel Value for CHANNEL LABEL: {}  SKIPPING!'.format(self.channel))
-            
-        self._instWrite('CHAN{}:LABel "{}"'.format(self.channel, label))
-        self._instWrite('DISPlay:LABel ON')
+        if (validList is None):
+            validList = self._chanAnaValidList
+        if (self.channel not in validList):
+            raise ValueError('INVALID Channel Value for {}: {}  SKIPPING!'.format(ctx, self.channel))
+
+        return self.channel
+
+    def channelLabel(self, label, channel=None):
+        """ Add a label to selected channel (or default one if None)
+
+            label - text of label
+        """
+
+        self._setScalarChannel(channel, 'CHANNEL LABEL')
+
+        # Chain both commands into one write/round-trip
+        self._instWrite(['CHAN{}:LABel "{}"'.format(self.channel, label),
+                         'DISPlay:LABel ON'])
 
     def channelLabelOff(self):
         """ Turn off channel labels """
@@ -226,31 +407,69 @@ class Keysight(Oscilloscope):
         self._instWrite('DISPlay:LABel OFF')
 
 
+    def _invalidateCachedState(self):
+        """Forget all cached sticky instrument settings.
+
+        Called after operations that can change instrument state
+        wholesale - reset, setup load, autoscale - so the caches get
+        re-established on next use instead of being trusted blindly.
+        """
+        self._waveState = None
+        self._lastMeasSrc = None
+        self._lastDvmSrc = None
+        self._dvmEnabled = None
+        self._bookmarkPosSet = False
+
+    def reset(self):
+        """Sends a *RST message to reset to defaults"""
+        result = super(Keysight, self).reset()
+        self._invalidateCachedState()
+        return result
+
+    def setupLoad(self, filename):
+        """ Restore the oscilloscope setup from file with given filename. """
+        result = super(Keysight, self).setupLoad(filename)
+        self._invalidateCachedState()
+        return result
+
+    def autoscale(self):
+        """ Autoscale Oscilloscope"""
+        super(Keysight, self).autoscale()
+        self._invalidateCachedState()
+
     def setupAutoscale(self, channel=None):
         """ Autoscale desired channel, which is a string. channel can also be a list of multiple strings"""
 
+        # Autoscale may change instrument state wholesale, so forget
+        # the cached sticky settings and re-query on next use
+        self._invalidateCachedState()
+
         # If a channel value is passed in, make it the
         # current channel and process the list, viewing only these channels
         if channel is not None:
             self.channel = channel
 
             # Make channel a list even if it is a single value
-            if type(self.channel) is not list:
+            if (not isinstance(self.channel, list)):
                 chanlist = [self.channel]
             else:
                 chanlist = self.channel
 
             # Turn off all channels
             self.outputOffAll()
-            
-            # Turn on selected channels
-            chanstr = ''
-            for chan in chanlist:                        
+
+            # Turn on selected channels. Validate first and chain the
+            # VIEW commands into a single compound write so the setup
+            # costs one round-trip regardless of channel count.
+            viewCmds = []
+            for chan in chanlist:
                 # Check channel value
                 if (chan not in self._chanAllValidList):
                     print('INVALID Channel Value for AUTOSCALE: {}  SKIPPING!'.format(chan))
                 else:
-                    self._instWrite("VIEW {}".format(chan))
+                    viewCmds.append("VIEW {}".format(chan))
+            if (viewCmds):
+                self._instWrite(';:'.join(viewCmds))
                     
         # Make sure Autoscale is only autoscaling displayed channels
         #@@@#self._instWrite("AUToscale:CHANnels DISPlayed")
@@ -271,126 +490,131 @@ class Keysight(Oscilloscope):
             self._instWrite("HARDcopy:INKSaver OFF")
             para = 'PNG,COLor'
 
-        scrImage = self._instQueryIEEEBlock("DISPlay:DATA? "+para)
+        # Stream display data straight to the file so the image never
+        # has to be held fully in memory. Write to a temp name and
+        # rename into place once complete, so a failed or interrupted
+        # transfer never leaves a truncated PNG at filename.
+        tmpname = filename + '.tmp'
+        try:
+            with open(tmpname, "wb") as f:
+                self._instQueryIEEEBlockToFile("DISPlay:DATA? "+para, f)
+        except Exception:
+            # clean up the partial file before re-raising
+            try:
+                os.remove(tmpname)
+            except OSError:
+                pass
+            raise
+        os.replace(tmpname, filename)
+
+
+    def _unpackPod(self, values, bits, typ):
+        """Split packed digital POD samples into per-bit rows.
+
+        Thin wrapper around _unpackPodBits() that, when numba is
+        available, reuses a persistent output buffer across captures -
+        repeated acquisitions of the same scope config then skip the
+        (bits, n) allocation entirely. NOTE: in that case the returned
+        array aliases the internal buffer and is overwritten by the
+        next digital capture, so copy it if it must survive.
+        """
+        if (_fast.HAVE_NUMBA):
+            if (self._digBuf is None
+                    or self._digBuf.shape != (bits, values.size)
+                    or self._digBuf.dtype != typ):
+                self._digBuf = np.empty((bits, values.size), typ)
+            return _unpackPodBits(values, bits, typ, self._digBuf)
+
+        return _unpackPodBits(values, bits, typ)
 
-        # Save display data values to file.
-        f = open(filename, "wb")
-        f.write(scrImage)
-        f.close()
+    def _podHeader(self, pod, bits):
+        """Return the waveform header for digital POD data.
 
+        The header only depends on (pod, bits), so build it once and
+        hand out copies - repeated captures in a tight loop then skip
+        the list comprehension entirely.
+        """
+        try:
+            header = self._podHeaderCache[(pod, bits)]
+        except KeyError:
+            header = ['Time (s)'] + ['D{}'.format((pod-1) * bits + ch) for ch in range(bits)]
+            self._podHeaderCache[(pod, bits)] = header
+
+        # copy so callers cannot mutate the cached list
+        return list(header)
 
     # =========================================================
     # Based on the Waveform data download example from the Keysight
     # Infiniium MXR/EXR-Series Oscilloscope Programmer's Guide and
     # modified to work within this class ...
     # =========================================================
-    def _waveformDataNew(self, channel, points=None):
-        """ Download the Waveform Data of a particular Channel and return it. """
+    def _waveformDataNew(self, channel, points=None, fmt='WORD', pack=False):
+        """ Download the Waveform Data of a particular Channel and return it.
+
+        fmt - 'WORD' (default) for 16-bit analog data with the highest
+        accuracy, or 'BYTE' to halve the bytes transferred when 8-bit
+        resolution is enough, such as display-only fetches. Ignored for
+        HIST and POD channels which have fixed formats.
+
+        pack - if True, return POD channel data as the packed sample
+        bytes, shape (n, bytes-per-sample), instead of unpacking into
+        per-bit rows. Saves the unpack (and a later re-pack) for
+        consumers that export the data in binary form. Ignored for
+        non-POD channels.
+        """
 
-        DEBUG = True
-        
         # Download waveform data.
         # --------------------------------------------------------
 
         # Create array for meta data
         meta = []
         
-        # Set the waveform source.
-        self._instWrite("WAVeform:SOURce {}".format(self.channelStr(channel)))
-        wav_source = self._instQuery("WAVeform:SOURce?")
-
-        # Get the waveform view.
-        wav_view = self._instQuery("WAVeform:VIEW?")
-        
         # Choose the format of the data returned.
         if (channel.startswith('HIST')):
             # Histogram so request BINary forma
-            self._instWrite("WAVeform:FORMat BINary")
+            wav_fmt = 'BINary'
         elif(channel == 'POD1' or channel == 'POD2'):
             # For POD1 and POD2, they really are only BYTE values
             # although WORD will work but the MSB will always be
             # 0. Setting this to BYTE here makes later code work out
             # by setting bits to 8 and npTyp to np.int8.
-            self._instWrite("WAVeform:FORMat BYTE")
+            wav_fmt = 'BYTE'
         else:
             # For analog data, WORD is the best and has the highest
             # accuracy (even better than FLOat). WORD works for most
-            # of the other channel types as well.
-            self._instWrite("WAVeform:FORMat WORD")
-        
+            # of the other channel types as well. The caller can
+            # request BYTE instead to halve the transfer size.
+            wav_fmt = fmt
+
         # Make sure byte order is set to be compatible with endian-ness of system
         if (sys.byteorder == 'big'):
             bo = 'MSBFirst'
         else:
             bo = 'LSBFirst'
-            
-        self._instWrite("WAVeform:BYTeorder " + bo)
 
-        #@@@#print('Waveform Format: ' + self._instQuery('WAV:FORM?'))
-        
-        # Display the waveform settings from preamble:
-        wav_form_dict = {
-            0 : "ASCii",
-            1 : "BYTE",
-            2 : "WORD",
-            3 : "LONG",
-            4 : "LONGLONG",
-            5 : "FLOat",
-        }
-        acq_type_dict = {
-            1 : "RAW",
-            2 : "AVERage",
-            3 : "VHIStogram",
-            4 : "HHIStogram",
-            6 : "INTerpolate",
-            9 : "DIGITAL",
-            10 : "PDETect",
-        }
-        acq_mode_dict = {
-            0 : "RTIMe",
-            1 : "ETIMe",
-            2 : "SEGMented",
-            3 : "PDETect",
-        }
-        coupling_dict = {
-            0 : "AC",
-            1 : "DC",
-            2 : "DCFIFTY",
-            3 : "LFREJECT",
-        }
-        units_dict = {
-            0 : "UNKNOWN",
-            1 : "VOLT",
-            2 : "SECOND",
-            3 : "CONSTANT",
-            4 : "AMP",
-            5 : "DECIBEL",
-            6 : "HERTZ",
-            7 : "WATT",
-        }
+        # Set the waveform source, format, byte order and streaming
+        # mode with a single compound command so the setup costs one
+        # round-trip instead of four. After SOURce, ';' keeps the
+        # :WAVeform path context for the following commands. No need to
+        # read the source back - it was just set, so use the string
+        # that was written.
+        #
+        # These are all sticky scope settings, so skip even this one
+        # write when it matches what was last sent - back-to-back
+        # fetches of the same channel then pay no setup round-trip at
+        # all. The cache is dropped on mode changes in case the new
+        # acquisition invalidated it.
+        wav_source = self.channelStr(channel)
+        setupCmd = "WAVeform:SOURce {};FORMat {};BYTeorder {};STReaming OFF".format(wav_source, wav_fmt, bo)
+        if (setupCmd != self._waveState):
+            self._instWrite(setupCmd)
+            self._waveState = setupCmd
 
-        units_abbrev_dict = {
-            0 : "?",
-            1 : "V",
-            2 : "s",
-            3 : "CONST.",
-            4 : "A",
-            5 : "dB",
-            6 : "Hz",
-            7 : "W",
-        }
+        # Get the waveform view.
+        wav_view = self._instQuery("WAVeform:VIEW?")
+
+        #@@@#print('Waveform Format: ' + self._instQuery('WAV:FORM?'))
 
-        units_axis_dict = {
-            0 : "UNKNOWN",
-            1 : "Voltage",
-            2 : "Time",
-            3 : "CONSTANT",
-            4 : "Current",
-            5 : "Decibels",
-            6 : "Frequency",
-            7 : "Power",
-        }
-        
         preamble_string = self._instQuery("WAVeform:PREamble?")
         (wav_form, acq_type, wfmpts, avgcnt, x_increment, x_origin,
          x_reference, y_increment, y_origin, y_reference, coupling,
@@ -399,39 +623,11 @@ class Keysight(Oscilloscope):
          completion, x_units, y_units, max_bw_limit, min_bw_limit
         ) = preamble_string.split(",")
 
-        meta.append(("Date","{}".format(date)))
-        meta.append(("Time","{}".format(time)))
-        meta.append(("Frame model #","{}".format(frame_model)))
-        meta.append(("Waveform source","{}".format(wav_source)))
-        meta.append(("Waveform view","{}".format(wav_view)))
-        meta.append(("Waveform format","{}".format(wav_form_dict[int(wav_form)])))
-        meta.append(("Acquire mode","{}".format(acq_mode_dict[int(acq_mode)])))
-        meta.append(("Acquire type","{}".format(acq_type_dict[int(acq_type)])))
-        meta.append(("Coupling","{}".format(coupling_dict[int(coupling)])))
-        meta.append(("Waveform points available","{}".format(wfmpts)))
-        meta.append(("Waveform average count","{}".format(avgcnt)))
-        meta.append(("Waveform X increment","{}".format(x_increment)))
-        meta.append(("Waveform X origin","{}".format(x_origin)))
-        meta.append(("Waveform X reference","{}".format(x_reference))) # Always 0.
-        meta.append(("Waveform Y increment","{}".format(y_increment)))
-        meta.append(("Waveform Y origin","{}".format(y_origin)))
-        meta.append(("Waveform Y reference","{}".format(y_reference))) # Always 0.
-        meta.append(("Waveform X display range","{}".format(x_display_range)))
-        meta.append(("Waveform X display origin","{}".format(x_display_origin)))
-        meta.append(("Waveform Y display range","{}".format(y_display_range)))
-        meta.append(("Waveform Y display origin","{}".format(y_display_origin)))
-        meta.append(("Waveform X units","{}".format(units_dict[int(x_units)])))
-        meta.append(("Waveform Y units","{}".format(units_dict[int(y_units)])))
-        meta.append(("Max BW limit","{}".format(max_bw_limit)))
-        meta.append(("Min BW limit","{}".format(min_bw_limit)))
-        meta.append(("Completion pct","{}".format(completion)))
-        
         # Convert some of the preamble to numeric values for later calculations.
-        #
-        # NOTE: These are already gathered from PREamble above but s
-        #
         acq_type    = int(acq_type)
         wav_form    = int(wav_form)
+        acq_mode    = int(acq_mode)
+        coupling    = int(coupling)
         x_units     = int(x_units)
         y_units     = int(y_units)
         x_increment = float(x_increment)
@@ -443,6 +639,35 @@ class Keysight(Oscilloscope):
         x_display_range  = float(x_display_range)
         x_display_origin = float(x_display_origin)
 
+        # The preamble fields are already strings, so collect the meta
+        # entries with one extend instead of 26 append + format calls.
+        meta.extend((("Date", date),
+                     ("Time", time),
+                     ("Frame model #", frame_model),
+                     ("Waveform source", wav_source),
+                     ("Waveform view", wav_view),
+                     ("Waveform format", _WAV_FORM[wav_form]),
+                     ("Acquire mode", _ACQ_MODE[acq_mode]),
+                     ("Acquire type", _ACQ_TYPE[acq_type]),
+                     ("Coupling", _COUPLING[coupling]),
+                     ("Waveform points available", wfmpts),
+                     ("Waveform average count", avgcnt),
+                     ("Waveform X increment", x_increment),
+                     ("Waveform X origin", x_origin),
+                     ("Waveform X reference", x_reference), # Always 0.
+                     ("Waveform Y increment", y_increment),
+                     ("Waveform Y origin", y_origin),
+                     ("Waveform Y reference", y_reference), # Always 0.
+                     ("Waveform X display range", x_display_range),
+                     ("Waveform X display origin", x_display_origin),
+                     ("Waveform Y display range", y_display_range),
+                     ("Waveform Y display origin", y_display_origin),
+                     ("Waveform X units", _UNITS[x_units]),
+                     ("Waveform Y units", _UNITS[y_units]),
+                     ("Max BW limit", max_bw_limit),
+                     ("Min BW limit", min_bw_limit),
+                     ("Completion pct", completion)))
+
         # Get the waveform data.
         pts = ''
         start = 0
@@ -456,12 +681,38 @@ class Keysight(Oscilloscope):
                 pts = ' {},{}'.format(start,points)
                 print('   As requested only downloading center {} points starting at {}\n'.format(points, ((x_reference + start) * x_increment) + x_origin))
             
-        self._instWrite("WAVeform:STReaming OFF")
-        sData = self._instQueryIEEEBlock("WAVeform:DATA?"+pts)
-
-        meta.append(("Waveform bytes downloaded","{}".format(len(sData))))
-        
-        if (DEBUG):
+        # Set parameters based on returned Waveform Format
+        #
+        # NOTE: Ignoring ASCII format
+        #
+        # BYTeorder was set above to match this system, so build the
+        # dtype with that same explicit endianness. The third entry is
+        # the struct-module element code for the transfer itself.
+        end = '>' if (sys.byteorder == 'big') else '<'
+        try:
+            (bits, typStr, typChar) = { 1 : ( 8, 'i1', 'b'),  # BYTE
+                                        2 : (16, 'i2', 'h'),  # WORD
+                                        3 : (32, 'i4', 'i'),  # LONG (unclear but believe this to be 32 bits)
+                                        4 : (64, 'i8', 'q'),  # LONGLONG
+                                        5 : (32, 'f4', 'f'),  # FLOAT (single-precision)
+                                       }[wav_form]
+        except KeyError:
+            raise RuntimeError('Unknown Waveform Format: ' + _WAV_FORM[wav_form])
+        npTyp = np.dtype(end + typStr)
+
+        # Pull the block straight into a numpy array - PyVISA parses
+        # the IEEE header and fills the array in one step, so no
+        # intermediate bytes object to decode afterwards. Use 1 MB
+        # read chunks so deep captures take many fewer reads than with
+        # the 20 KB PyVISA default. STReaming was already turned OFF in
+        # the setup command above.
+        values = self._instQueryIEEEArray("WAVeform:DATA?"+pts, typChar,
+                                          is_big_endian=(sys.byteorder == 'big'),
+                                          chunk_size=1024*1024)
+
+        meta.append(("Waveform bytes downloaded", values.size * values.itemsize))
+
+        if (self._debug):
             # Wait until after data transfer to output meta data so
             # that the preamble data is captured as close to the data
             # as possible.
@@ -469,57 +720,6 @@ class Keysight(Oscilloscope):
                 print("{:>27}: {}".format(mm[0],mm[1]))
             print()
 
-        # Set parameters based on returned Waveform Format
-        #
-        # NOTE: Ignoring ASCII format
-        if (wav_form == 1):
-            # BYTE
-            bits = 8
-            npTyp = np.int8
-            unpackStr = "@%db" % (len(sData)//(bits//8))
-        elif (wav_form == 2):
-            # WORD
-            bits = 16
-            npTyp = np.int16
-            unpackStr = "@%dh" % (len(sData)//(bits//8))
-        elif (wav_form == 3):
-            # LONG (unclear but believe this to be 32 bits)
-            bits = 32
-            npTyp = np.int32
-            unpackStr = "@%dl" % (len(sData)//(bits//8))
-        elif (wav_form == 4):
-            # LONGLONG
-            bits = 64
-            npTyp = np.int64
-            unpackStr = "@%dq" % (len(sData)//(bits//8))
-        elif (wav_form == 5):
-            # FLOAT (single-precision)
-            bits = 32
-            npTyp = np.float32
-            unpackStr = "@%df" % (len(sData)//(bits//8))
-        else:
-            raise RuntimeError('Unknown Waveform Format: ' + wav_form_dict[wav_form])
-        
-        # Unpack signed byte data.
-        if (version_info < (3,)):
-            ## If PYTHON 2, sData will be a string and needs to be converted into a list of integers
-            #
-            # NOTE: not sure if this still works - besides PYTHON2 support is deprecated
-            values = np.array([ord(x) for x in sData], dtype=np.int8)
-        else:
-            ## If PYTHON 3, 
-            # Unpack signed data and store in proper type
-            #
-            # If the acquire type is HHIStogram or VHIStogram, the data is signed 64-bit integers
-            #if (acq_type == 3 or acq_type == 4):
-            #    unpackStr = "@%dq" % (len(sData)//8)
-            #    unpackTyp = np.int64
-            #else:
-            #    unpackStr = "@%dh" % (len(sData)//2)
-            #    unpackTyp = np.int16
-
-            values = np.array(struct.unpack(unpackStr, sData), dtype=npTyp)
-            
         nLength = len(values)
         meta.append(("Number of data values","{:d}".format(nLength)))
 
@@ -528,7 +728,11 @@ class Keysight(Oscilloscope):
         # NOTE: Documentation currently say x_reference should
         # always be 0 but still including it in equation in case
         # that changes in the future
-        x = ((np.arange(nLength) - x_reference + start) * x_increment) + x_origin
+        #
+        # np.linspace fills the evenly spaced axis in one kernel with a
+        # single allocation, instead of an arange plus arithmetic passes.
+        x0 = ((start - x_reference) * x_increment) + x_origin
+        x = np.linspace(x0, x0 + (nLength - 1) * x_increment, nLength)
 
         # If the acquire type is DIGITAL, the y data
         # does not need to be converted to an analog value
@@ -554,13 +758,19 @@ class Keysight(Oscilloscope):
                 else:
                     # Grab number suffix to determine which bit to start with
                     pod = int(channel[-1])
-                                
-                # So y will be a 2D array where y[0] is time array of bit 0, y[1] for bit 1, etc.
-                y = np.empty((bits, len(values)),npTyp)
-                for ch in range(bits):
-                    y[ch] = (values >> ch) & 1
 
-                header = ['Time (s)'] + ['D{}'.format((pod-1) * bits + ch) for ch in range(bits)]
+                if (pack):
+                    # hand back the packed sample bytes straight from
+                    # the transfer buffer (little-endian, low byte
+                    # first) - consumers that re-pack or write binary
+                    # skip the unpack entirely
+                    y = values.view(np.uint8).reshape(values.size, -1)[:, :((bits + 7) // 8)]
+                    header = ['Time (s)', 'Bits (packed)']
+                else:
+                    # So y will be a 2D array where y[0] is time array of bit 0, y[1] for bit 1, etc.
+                    y = self._unpackPod(values, bits, npTyp)
+
+                    header = self._podHeader(pod, bits)
                     
         else:
             # create an array of vertical data (typ. Voltages)
@@ -568,61 +778,218 @@ class Keysight(Oscilloscope):
             if (wav_form == 5):
                 # If Waveform Format is FLOAT, then conversion not needed
                 y = values
+            elif (_fast.HAVE_NUMBA):
+                # single fused native pass, threaded across cores, when
+                # numba is available
+                y = _fast.scaleSamples(values, y_reference, y_increment, y_origin, bits)
             else:
                 # NOTE: Documentation currently say y_reference should
                 # always be 0 but still including it in equation in case
-                # that changes in the future                    
-                y = ((values - y_reference) * y_increment) + y_origin
-
-            header = [f'{units_axis_dict[x_units]} ({units_abbrev_dict[x_units]})', f'{units_axis_dict[y_units]} ({units_abbrev_dict[y_units]})']
+                # that changes in the future
+                #
+                # Scale with in-place ufuncs on one preallocated
+                # buffer. Folding the reference subtraction into the
+                # additive constant makes it a multiply plus one add -
+                # two passes over the samples instead of three, with
+                # the constant combined once in float64. float32
+                # represents 8/16-bit sample codes exactly and halves
+                # the bytes moved; the wider integer formats keep
+                # float64.
+                flt = np.float32 if (bits <= 16) else np.float64
+                y = np.empty(nLength, dtype=flt)
+                np.multiply(values, flt(y_increment), out=y)
+                y += flt(y_origin - (y_reference * y_increment))
+
+            header = [f'{_UNITS_AXIS[x_units]} ({_UNITS_ABBREV[x_units]})', f'{_UNITS_AXIS[y_units]} ({_UNITS_ABBREV[y_units]})']
 
             
         # Return the data in numpy arrays along with the header & meta data
         return (x, y, header, meta)
-        
+
+    def _waveformDataNewAnalog(self, channel, points=None):
+        """ Specialization of _waveformDataNew() for analog WORD downloads.
+
+        The overwhelming majority of fetches are 16-bit analog, so this
+        straight-line version hardcodes that case - no waveform format
+        dispatch and none of the histogram/POD/BUS branches. Returns
+        exactly what _waveformDataNew() would for the same channel.
+        """
+
+        # Create array for meta data
+        meta = []
+
+        # Make sure byte order is set to be compatible with endian-ness of system
+        bo = 'MSBFirst' if (sys.byteorder == 'big') else 'LSBFirst'
+
+        # Single compound setup write, skipped entirely when the sticky
+        # settings already match - see _waveformDataNew()
+        wav_source = self.channelStr(channel)
+        setupCmd = "WAVeform:SOURce {};FORMat WORD;BYTeorder {};STReaming OFF".format(wav_source, bo)
+        if (setupCmd != self._waveState):
+            self._instWrite(setupCmd)
+            self._waveState = setupCmd
+
+        # Get the waveform view.
+        wav_view = self._instQuery("WAVeform:VIEW?")
+
+        preamble_string = self._instQuery("WAVeform:PREamble?")
+        (wav_form, acq_type, wfmpts, avgcnt, x_increment, x_origin,
+         x_reference, y_increment, y_origin, y_reference, coupling,
+         x_display_range, x_display_origin, y_display_range,
+         y_display_origin, date, time, frame_model, acq_mode,
+         completion, x_units, y_units, max_bw_limit, min_bw_limit
+        ) = preamble_string.split(",")
+
+        # Convert some of the preamble to numeric values for later calculations.
+        acq_type    = int(acq_type)
+        wav_form    = int(wav_form)
+        acq_mode    = int(acq_mode)
+        coupling    = int(coupling)
+        x_units     = int(x_units)
+        y_units     = int(y_units)
+        x_increment = float(x_increment)
+        x_origin    = float(x_origin)
+        x_reference = int(float(x_reference))
+        y_increment = float(y_increment)
+        y_origin    = float(y_origin)
+        y_reference = int(float(y_reference))
+        x_display_range  = float(x_display_range)
+        x_display_origin = float(x_display_origin)
+
+        meta.extend((("Date", date),
+                     ("Time", time),
+                     ("Frame model #", frame_model),
+                     ("Waveform source", wav_source),
+                     ("Waveform view", wav_view),
+                     ("Waveform format", _WAV_FORM[wav_form]),
+                     ("Acquire mode", _ACQ_MODE[acq_mode]),
+                     ("Acquire type", _ACQ_TYPE[acq_type]),
+                     ("Coupling", _COUPLING[coupling]),
+                     ("Waveform points available", wfmpts),
+                     ("Waveform average count", avgcnt),
+                     ("Waveform X increment", x_increment),
+                     ("Waveform X origin", x_origin),
+                     ("Waveform X reference", x_reference), # Always 0.
+                     ("Waveform Y increment", y_increment),
+                     ("Waveform Y origin", y_origin),
+                     ("Waveform Y reference", y_reference), # Always 0.
+                     ("Waveform X display range", x_display_range),
+                     ("Waveform X display origin", x_display_origin),
+                     ("Waveform Y display range", y_display_range),
+                     ("Waveform Y display origin", y_display_origin),
+                     ("Waveform X units", _UNITS[x_units]),
+                     ("Waveform Y units", _UNITS[y_units]),
+                     ("Max BW limit", max_bw_limit),
+                     ("Min BW limit", min_bw_limit),
+                     ("Completion pct", completion)))
+
+        # Get the waveform data.
+        pts = ''
+        start = 0
+        if (points is not None):
+            # If want subset of points, grab them from the center of display
+            midpt = int((((x_display_range / 2) + x_display_origin) - x_origin) / x_increment)
+            start = midpt - (points // 2)
+            pts = ' {},{}'.format(start,points)
+            print('   As requested only downloading center {} points starting at {}\n'.format(points, ((x_reference + start) * x_increment) + x_origin))
+
+        # Pull the block straight into an int16 numpy array
+        values = self._instQueryIEEEArray("WAVeform:DATA?"+pts, 'h',
+                                          is_big_endian=(sys.byteorder == 'big'),
+                                          chunk_size=1024*1024)
+
+        meta.append(("Waveform bytes downloaded", values.size * values.itemsize))
+
+        if (self._debug):
+            # Wait until after data transfer to output meta data so
+            # that the preamble data is captured as close to the data
+            # as possible.
+            for mm in meta:
+                print("{:>27}: {}".format(mm[0],mm[1]))
+            print()
+
+        nLength = len(values)
+        meta.append(("Number of data values","{:d}".format(nLength)))
+
+        # create an array of time values - see _waveformDataNew()
+        x0 = ((start - x_reference) * x_increment) + x_origin
+        x = np.linspace(x0, x0 + (nLength - 1) * x_increment, nLength)
+
+        # create an array of vertical data (typ. Voltages)
+        if (_fast.HAVE_NUMBA):
+            # 16-bit samples (transferred as int16 above)
+            y = _fast.scaleSamples(values, y_reference, y_increment, y_origin, 16)
+        else:
+            # fused in-place scaling, with the reference folded into
+            # the additive constant so it is two passes instead of
+            # three - float32 holds 16-bit sample codes exactly (see
+            # _waveformDataNew())
+            y = np.empty(nLength, dtype=np.float32)
+            np.multiply(values, np.float32(y_increment), out=y)
+            y += np.float32(y_origin - (y_reference * y_increment))
+
+        header = [f'{_UNITS_AXIS[x_units]} ({_UNITS_ABBREV[x_units]})', f'{_UNITS_AXIS[y_units]} ({_UNITS_ABBREV[y_units]})']
+
+        # Return the data in numpy arrays along with the header & meta data
+        return (x, y, header, meta)
+
     # =========================================================
     # Based on the Waveform data download example from the MSO-X 3000 Programming
     # Guide and modified to work within this class ...
     # =========================================================
-    def _waveformDataLegacy(self, channel, points=None):
-        """ Download the Waveform Data of a particular Channel and return it. """
+    def _waveformDataLegacy(self, channel, points=None, fmt='BYTE', pack=False):
+        """ Download the Waveform Data of a particular Channel and return it.
+
+        fmt - 'BYTE' (default) for 8-bit data or 'WORD' for 16-bit data,
+        which preserves full resolution for AVERage/HRESolution
+        acquisitions at twice the transfer size.
+
+        pack - if True, return POD channel data as the packed sample
+        bytes, shape (n, bytes-per-sample), instead of unpacking into
+        per-bit rows (see _waveformDataNew()). Ignored for non-POD
+        channels.
+        """
 
-        DEBUG = True
-            
         # Download waveform data.
         # --------------------------------------------------------
 
         # Create array for meta data
         meta = []
 
-        # Set the waveform source.
-        self._instWrite("WAVeform:SOURce {}".format(self.channelStr(channel)))
+        # Set the waveform source, the format of the data returned,
+        # Unsigned data which is compatible with PODx, and the points
+        # mode, all with a single compound command so setup costs one
+        # round-trip instead of four. After SOURce, ';' keeps the
+        # :WAVeform path context for the following commands. No need
+        # to read the settings back - the preamble below reports the
+        # resulting number of points.
+        #
+        # NOTE: With this Legacy software, setting POINts decimated
+        # the data so that you would still get a display's worth but
+        # not every single time bucket. This works differently for the
+        # newer software where points picks the number of points in
+        # the center of the display to send but every consecutive time
+        # bucket is sent.
+        setupCmd = "WAVeform:SOURce {};FORMat {};UNSigned ON".format(self.channelStr(channel), fmt)
+        if (fmt == 'WORD'):
+            # Pin the byte order so the decode below is deterministic.
+            # Must come while the path is still :WAVeform - after the
+            # POINts:MODE command below, the path context is
+            # :WAVeform:POINts and a relative header no longer parses.
+            setupCmd += ";BYTeorder LSBFirst"
+        setupCmd += ";POINts:MODE MAX"
+        if (points is not None):
+            # after POINts:MODE the path context is :WAVeform:POINts,
+            # so a relative ';POINts' would be the undefined header
+            # :WAVeform:POINts:POINts - restart from the root with ';:'
+            setupCmd += ";:WAVeform:POINts {}".format(points)
+        self._instWrite(setupCmd)
         wav_source = self._instQuery("WAVeform:SOURce?")
 
         # Get the waveform view.
         wav_view = self._instQuery("WAVeform:VIEW?")
-        
-        # Choose the format of the data returned:
-        self._instWrite("WAVeform:FORMat BYTE")
-
-        # Set to Unsigned data which is compatible with PODx
-        self._instWrite("WAVeform:UNSigned ON")
 
-        # Set the waveform points mode.
-        self._instWrite("WAVeform:POINts:MODE MAX")
-        wav_points_mode = self._instQuery("WAVeform:POINts:MODE?")
-
-        # Set the number of waveform points to fetch, if it was passed in.
-        #
-        # NOTE: With this Legacy software, this decimated the data so
-        # that you would still get a display's worth but not every
-        # single time bucket. This works differently for the newer
-        # software where above points picks the number of points in
-        # the center of the display to send but every consecutive time
-        # bucket is sent.
-        if (points is not None):
-            self._instWrite("WAVeform:POINts {}".format(points))
-        wav_points = int(self._instQuery("WAVeform:POINts?"))
+        wav_points_mode = "MAX"
 
         # Display the waveform settings from preamble:
         wav_form_dict = {
@@ -674,7 +1041,7 @@ class Keysight(Oscilloscope):
         meta.append(("Waveform format","{}".format(wav_form_dict[int(wav_form)])))
         meta.append(("Acquire type","{}".format(acq_type_dict[int(acq_type)])))
         meta.append(("Waveform points mode","{}".format(wav_points_mode)))
-        meta.append(("Waveform points available","{}".format(wav_points)))
+        meta.append(("Waveform points available","{:d}".format(wfmpts)))
         meta.append(("Waveform points desired","{:d}".format((wfmpts))))
         meta.append(("Waveform average count","{:d}".format(avgcnt)))
         meta.append(("Waveform X increment","{:1.12f}".format(x_increment)))
@@ -694,12 +1061,19 @@ class Keysight(Oscilloscope):
         y_increment = float(y_increment)
         y_origin    = float(y_origin)
 
-        # Get the waveform data.
-        sData = self._instQueryIEEEBlock("WAVeform:DATA?")
-
-        meta.append(("Waveform bytes downloaded","{}".format(len(sData))))
+        # Get the waveform data straight into a numpy array - PyVISA
+        # parses the IEEE header and fills the array in one step. Use
+        # 1 MB read chunks so deep captures take many fewer reads than
+        # with the 20 KB PyVISA default. Data is unsigned (set above);
+        # WORD byte order was pinned to LSBFirst.
+        data = self._instQueryIEEEArray("WAVeform:DATA?",
+                                        'H' if (fmt == 'WORD') else 'B',
+                                        is_big_endian=False,
+                                        chunk_size=1024*1024)
+
+        meta.append(("Waveform bytes downloaded", data.size * data.itemsize))
         
-        if (DEBUG):
+        if (self._debug):
             # Wait until after data transfer to output meta data so
             # that the preamble data is captured as close to the data
             # as possible.
@@ -707,21 +1081,20 @@ class Keysight(Oscilloscope):
                 print("{:>27}: {}".format(mm[0],mm[1]))
             print()
         
-        if (version_info < (3,)):
-            ## If PYTHON 2, sData will be a string and needs to be converted into a list of integers
-            #
-            # NOTE: not sure if this still works - besides PYTHON2 support is deprecated
-            values = np.array([ord(x) for x in sData], dtype=np.int8)
+        if (fmt == 'WORD'):
+            # Store in int32 so room to convert unsigned to signed
+            values = data.astype(np.int32)
         else:
-            ## If PYTHON 3, 
-            # Unpack unsigned byte data and store in int16 so room to convert unsigned to signed
-            values = np.array(struct.unpack("%dB" % len(sData), sData), dtype=np.int16)
+            # Store in int16 so room to convert unsigned to signed
+            values = data.astype(np.int16)
 
         nLength = len(values)
         meta.append(("Number of data values","{:d}".format(nLength)))
 
-        # create an array of time values
-        x = ((np.arange(nLength) - x_reference) * x_increment) + x_origin
+        # create an array of time values - one linspace kernel instead
+        # of an arange plus arithmetic passes
+        x0 = (-x_reference * x_increment) + x_origin
+        x = np.linspace(x0, x0 + (nLength - 1) * x_increment, nLength)
 
         if (channel.startswith('BUS')):
             # If the channel name starts with BUS, then data is not
@@ -741,25 +1114,48 @@ class Keysight(Oscilloscope):
                 bits = 8
                 typ = np.int8
 
-            # So y will be a 2D array where y[0] is time array of bit 0, y[1] for bit 1, etc.
-            y = np.empty((bits, len(values)),typ)
-            for ch in range(bits):
-                y[ch] = (values >> ch) & 1
+            if (pack):
+                # hand back the packed sample bytes straight from the
+                # transfer buffer (little-endian, low byte first) -
+                # consumers that re-pack or write binary skip the
+                # unpack entirely
+                y = data.view(np.uint8).reshape(data.size, -1)[:, :((bits + 7) // 8)]
+                header = ['Time (s)', 'Bits (packed)']
+            else:
+                # So y will be a 2D array where y[0] is time array of bit 0, y[1] for bit 1, etc.
+                #
+                # Unpack from the raw unsigned transfer array - the
+                # widened signed copy above is only needed for the
+                # analog math, and using it here would force the helper
+                # to narrow it back down again with another full pass.
+                y = self._unpackPod(data, bits, typ)
 
-            # Put number of POD into 'pod'
-            pod = int(channel[-1])
-            header = ['Time (s)'] + ['D{}'.format((pod-1) * bits + ch) for ch in range(bits)]
+                # Put number of POD into 'pod'
+                pod = int(channel[-1])
+                header = self._podHeader(pod, bits)
                 
         else:
             # create an array of vertical data (typ. Voltages)
-            y = ((values - y_reference) * y_increment) + y_origin
+            if (_fast.HAVE_NUMBA):
+                # single fused native pass when numba is available -
+                # pass the logical sample width since the int32
+                # container hides that WORD codes are only 16 bits
+                y = _fast.scaleSamples(values, y_reference, y_increment, y_origin,
+                                       16 if (fmt == 'WORD') else 8)
+            else:
+                # fused in-place scaling with the reference folded into
+                # the additive constant - float32 holds the 8/16-bit
+                # legacy sample codes exactly (see _waveformDataNew())
+                y = np.empty(values.size, dtype=np.float32)
+                np.multiply(values, np.float32(y_increment), out=y)
+                y += np.float32(y_origin - (y_reference * y_increment))
+
+            header = list(_ANALOG_HEADER)
 
-            header = ['Time (s)', 'Voltage (V)']
-        
         # Return the data in numpy arrays along with the header & meta data
         return (x, y, header, meta)
 
-    def waveformData(self, channel=None, points=None):
+    def waveformData(self, channel=None, points=None, fmt=None, pack=False):
         """ Download waveform data of a selected channel
 
         channel  - channel, as string, to be measured - set to None to use the default channel
@@ -767,26 +1163,34 @@ class Keysight(Oscilloscope):
         points   - number of points to capture - if None, captures all available points
                    for newer devices, the captured points are centered around the center of the display
 
+        fmt      - requested waveform format, as a string, or None to use the
+                   per-device default ('WORD' for newer devices for best accuracy,
+                   'BYTE' for legacy ones). 'BYTE' halves the bytes transferred
+                   on newer devices when 8-bit resolution is enough.
+
+        pack     - if True, POD channel data is returned as packed sample
+                   bytes instead of per-bit rows, skipping the unpack for
+                   consumers that export binary data. Ignored for non-POD
+                   channels.
+
         """
         
-        # If a channel value is passed in, make it the
-        # current channel
-        if channel is not None and type(channel) is not list:
-            self.channel = channel
+        self._setScalarChannel(channel, 'WAVEFORM', self.chanAllValidSet)
 
-        # Make sure channel is NOT a list
-        if type(self.channel) is list or type(channel) is list:
-            raise ValueError('Channel cannot be a list for WAVEFORM!')
-
-        # Check channel value
-        if (self.channel not in self.chanAllValidList):
-            raise ValueError('INVALID Channel Value for WAVEFORM: {}  SKIPPING!'.format(self.channel))            
 
-        
+        # If no format requested, let each path use its own default
+        kwargs = {} if (fmt is None) else {'fmt': fmt}
+        if (pack):
+            kwargs['pack'] = True
         if (self._version > self._versionLegacy):
-            (x, y, header, meta) = self._waveformDataNew(self.channel, points)
+            if ((fmt is None or fmt == 'WORD') and self.channel.startswith('CHAN')):
+                # the common case - analog WORD download - gets the
+                # lean specialized path
+                (x, y, header, meta) = self._waveformDataNewAnalog(self.channel, points)
+            else:
+                (x, y, header, meta) = self._waveformDataNew(self.channel, points, **kwargs)
         else:
-            (x, y, header, meta) = self._waveformDataLegacy(self.channel, points)        
+            (x, y, header, meta) = self._waveformDataLegacy(self.channel, points, **kwargs)
 
         return (x, y, header, meta)
         
@@ -805,71 +1209,79 @@ class Keysight(Oscilloscope):
         return statFlat
     
 
-    def _readDVM(self, mode, channel=None, timeout=None, wait=0.5):
-        """Read the DVM data of desired channel and return the value.
-
-        channel: channel, as a string, to set to DVM mode and return its
-        reading - becomes the default channel for future readings
-
-        timeout: if None, no timeout, otherwise, time-out in seconds
-        waiting for a valid number
+    def _setupDVM(self, channel=None):
+        """Validate channel, enable DVM if needed and select the DVM source channel.
 
-        wait: Number of seconds after select DVM mode before trying to
-        read values. Set to None for no waiting (not recommended)
+        channel: channel, as a string, to set to DVM mode - becomes the
+        default channel for future readings
         """
 
         if (self.series == 'KEYSIGHT' or self.series == 'UXR'):
             # Generic Keysight and UXR do not support DVM
             raise RuntimeError(f"This machine appears to be of the {self.series} series which does not support DVM")
 
-        if (mode == 'FREQ' and self.series != "MSOX3" and self.series != "DSOX3"):
-            # This device does not support DVM:FREQ? so simply return an invalid, overrange number
-            return self.OverRange
-        
-        # If a channel value is passed in, make it the
-        # current channel
-        if channel is not None and type(channel) is not list:
-            self.channel = channel
+        self._setScalarChannel(channel, 'DVM')
 
-        # Make sure channel is NOT a list
-        if type(self.channel) is list or type(channel) is list:
-            raise ValueError('Channel cannot be a list for DVM!')
+        # First check if DVM is enabled. Once we know it is, trust the
+        # cached flag instead of paying the DVM:ENABle? query
+        # round-trip on every reading.
+        if (not self._dvmEnabled):
+            if (not self.DVMisEnabled()):
+                # It is not enabled, so enable it
+                self.enableDVM(True)
+            self._dvmEnabled = True
 
-        # Check channel value
-        if (self.channel not in self._chanAnaValidList):
-            raise ValueError('INVALID Channel Value for DVM: {}  SKIPPING!'.format(self.channel))
-            
-        # First check if DVM is enabled
-        if (not self.DVMisEnabled()):
-            # It is not enabled, so enable it
-            self.enableDVM(True)
-            
         # Next check if desired DVM channel is the source, if not switch it
         #
         # NOTE: doing it this way so as to not possibly break the
         # moving average since do not know if buffers are cleared when
         # the SOURCE command is sent even if the channel does not
         # change.
-        src = self._instQuery("DVM:SOURce?")
-        #print("Source: {}".format(src))
-        if (self._chanNumber(src) != self.channel):
+        #
+        # Trust the cached source from the last time we set it and skip
+        # the SOURce? query round-trip; only ask the scope when the
+        # cache is cold (start of session, or after autoscale).
+        if (self._lastDvmSrc is None):
+            self._lastDvmSrc = str(self._chanNumber(self._instQuery("DVM:SOURce?")))
+        #print("Source: {}".format(self._lastDvmSrc))
+        if (self._lastDvmSrc != self.channel):
             # Different channel value so switch it
             #print("Switching to {}".format(self.channel))
             self._instWrite("DVM:SOURce {}".format(self.channelStr(self.channel)))
+            self._lastDvmSrc = self.channel
+
+    def _queryDVM(self, mode, timeout=None, wait=0.5, use_opc=True):
+        """Select DVM mode and read its value. Expects _setupDVM() to have been called.
+
+        mode: the DVM mode, as a string, like ACRM, DC, DCRM or FREQ
+
+        timeout: if None, no timeout, otherwise, time-out in seconds
+        waiting for a valid number
+
+        wait: Number of seconds after select DVM mode before trying to
+        read values. Set to None for no waiting (not recommended)
+
+        use_opc: if True, synchronize with *OPC? instead of sleeping
+        wait seconds. Set to False for scopes that do not respect OPC
+        for DVM mode switches, in which case wait is used as before.
+        """
 
         # Select the desired DVM mode
         self._instWrite("DVM:MODE {}".format(mode))
 
-        # wait a little before read value to make sure everything is switched
-        if (wait):
+        # make sure everything is switched before reading the value -
+        # *OPC? blocks in the instrument only as long as the switch
+        # actually takes, where sleep() always burns the full wait
+        if (use_opc):
+            self._instQuery("*OPC?")
+        elif (wait):
             sleep(wait)
 
         # Read value until get one < +9.9E+37 (per programming guide suggestion)
-        startTime = datetime.now()
+        startTime = monotonic()
         val = self.OverRange
         while (val >= self.OverRange):
-            duration = datetime.now() - startTime
-            if (timeout is not None and duration.total_seconds() >= timeout):
+            if (timeout is not None and (monotonic() - startTime) >= timeout):
                 # if timeout is a value and have been waiting that
                 # many seconds for a valid DVM value, stop waiting and
                 # return this self.OverRange number.
@@ -877,18 +1289,79 @@ class Keysight(Oscilloscope):
 
             val = self._instQueryNumber("DVM:CURRent?")
 
+            if (val >= self.OverRange):
+                # give the scope a moment to produce a reading instead
+                # of hammering it with back-to-back queries
+                sleep(0.01)
+
         # if mode is frequency, read and return the 5-digit frequency instead
         if (mode == "FREQ"):
             val = self._instQueryNumber("DVM:FREQ?")
 
         return val
 
-    def DVMisEnabled(self):
-        """Return True is DVM is enabled, else False"""
+    def _readDVM(self, mode, channel=None, timeout=None, wait=0.5, use_opc=True):
+        """Read the DVM data of desired channel and return the value.
 
-        if (self.series == 'KEYSIGHT' or self.series == 'UXR'):
-            # Generic Keysight and UXR do not support DVM
-            raise RuntimeError(f"This machine appears to be of the {self.series} series which does not support DVM")
+        channel: channel, as a string, to set to DVM mode and return its
+        reading - becomes the default channel for future readings
+
+        timeout: if None, no timeout, otherwise, time-out in seconds
+        waiting for a valid number
+
+        wait: Number of seconds after select DVM mode before trying to
+        read values. Set to None for no waiting (not recommended)
+
+        use_opc: if True, synchronize with *OPC? instead of sleeping
+        wait seconds (see _queryDVM())
+        """
+
+        if (mode == 'FREQ' and self.series != "MSOX3" and self.series != "DSOX3"):
+            # This device does not support DVM:FREQ? so simply return an invalid, overrange number
+            return self.OverRange
+
+        self._setupDVM(channel)
+
+        return self._queryDVM(mode, timeout, wait, use_opc)
+
+    def measureDVMall(self, channel=None, timeout=None, wait=0.5):
+        """Measure and return all DVM readings of channel as a dictionary.
+
+        Performs the DVM enable check and source selection once and
+        then reads each mode in turn, instead of paying those SCPI
+        round-trips again for every individual measureDVM*() call.
+
+        Returned dictionary has keys 'ACRMS', 'DC', 'DCRMS' and
+        'FREQ'. 'FREQ' is set to self.OverRange on series that do not
+        support the DVM:FREQ? command.
+
+        channel: channel, as a string, to set to DVM mode and return its
+        reading - becomes the default channel for future readings
+
+        timeout: if None, no timeout, otherwise, time-out in seconds
+        waiting for a valid number - if timeout, value is self.OverRange
+        """
+
+        self._setupDVM(channel)
+
+        readings = {'ACRMS': self._queryDVM("ACRM", timeout, wait),
+                    'DC':    self._queryDVM("DC", timeout, wait),
+                    'DCRMS': self._queryDVM("DCRM", timeout, wait)}
+
+        if (self.series == "MSOX3" or self.series == "DSOX3"):
+            # These series are the only ones known to support DVM:FREQ? command
+            readings['FREQ'] = self._queryDVM("FREQ", timeout, wait)
+        else:
+            readings['FREQ'] = self.OverRange
+
+        return readings
+
+    def DVMisEnabled(self):
+        """Return True is DVM is enabled, else False"""
+
+        if (self.series == 'KEYSIGHT' or self.series == 'UXR'):
+            # Generic Keysight and UXR do not support DVM
+            raise RuntimeError(f"This machine appears to be of the {self.series} series which does not support DVM")
 
         en = self._instQuery("DVM:ENABle?")
         return self._1OR0(en)
@@ -908,6 +1381,9 @@ class Keysight(Oscilloscope):
         else:
             self._instWrite("DVM:ENABLE OFF")
 
+        # keep the cached enable state in sync - see _setupDVM()
+        self._dvmEnabled = enable
+
         
     def measureDVMacrms(self, channel=None, timeout=None, wait=0.5):
         """Measure and return the AC RMS reading of channel using DVM
@@ -970,7 +1446,7 @@ class Keysight(Oscilloscope):
 
         return self._readDVM("FREQ", channel, timeout, wait)
 
-    def _measure(self, mode, para=None, channel=None, wait=0.25, install=False):
+    def _measure(self, mode, para=None, channel=None, wait=0.25, install=False, use_opc=True):
         """Read and return a measurement of type mode from channel
 
            mode - selected measurement as a string
@@ -982,33 +1458,35 @@ class Keysight(Oscilloscope):
            wait - if not None, number of seconds to wait before querying measurement
 
            install - if True, adds measurement to the statistics display
-        """
 
-        # If a channel value is passed in, make it the
-        # current channel
-        if channel is not None and type(channel) is not list:
-            self.channel = channel
+           use_opc - if True, synchronize with *OPC? instead of
+           sleeping wait seconds; the query returns as soon as the
+           scope finishes reconfiguring, which is usually much sooner
+           than the fixed wait. Set to False for scopes that do not
+           respect OPC for measurement setup, in which case wait is
+           used as before.
+        """
 
-        # Make sure channel is NOT a list
-        if type(self.channel) is list or type(channel) is list:
-            raise ValueError('Channel cannot be a list for MEASURE!')
+        self._setScalarChannel(channel, 'MEASURE')
 
-        # Check channel value
-        if (self.channel not in self._chanAnaValidList):
-            raise ValueError('INVALID Channel Value for MEASURE: {}  SKIPPING!'.format(self.channel))
-            
         # Next check if desired channel is the source, if not switch it
         #
         # NOTE: doing it this way so as to not possibly break the
         # moving average since do not know if buffers are cleared when
         # the SOURCE command is sent even if the channel does not
         # change.
-        src = self._instQuery("MEASure:SOURce?")
-        #print("Source: {}".format(src))
-        if (self._chanNumber(src) != self.channel):
+        #
+        # Trust the cached source from the last time we set it and skip
+        # the SOURce? query round-trip; only ask the scope when the
+        # cache is cold (start of session, or after autoscale).
+        if (self._lastMeasSrc is None):
+            self._lastMeasSrc = str(self._chanNumber(self._instQuery("MEASure:SOURce?")))
+        #print("Source: {}".format(self._lastMeasSrc))
+        if (self._lastMeasSrc != self.channel):
             # Different channel so switch it
             #print("Switching to {}".format(self.channel))
             self._instWrite("MEASure:SOURce {}".format(self.channelStr(self.channel)))
+            self._lastMeasSrc = self.channel
 
         if (para):
             # Need to add parameters to the write and query strings
@@ -1028,8 +1506,12 @@ class Keysight(Oscilloscope):
                 self._instWrite("MEASure:STATistics:DISPlay ON")
             self._instWrite(strWr)
 
-        # wait a little before read value, if wait is not None
-        if (wait):
+        # synchronize before reading the value - *OPC? blocks in the
+        # instrument only as long as the reconfiguration actually
+        # takes, where sleep() always burns the full wait
+        if (use_opc):
+            self._instQuery("*OPC?")
+        elif (wait):
             sleep(wait)
 
         # query the measurement (do not have to install to query it)
@@ -1038,6 +1520,75 @@ class Keysight(Oscilloscope):
         return float(val)
 
 
+    def measureMany(self, modes, channel=None, wait=0.25):
+        """Install several measurements and read them all back with a
+        single MEASure:RESults? query.
+
+        Calling the individual measureXxx() methods in sequence pays a
+        source check, a wait and a query round-trip for each one; this
+        installs every requested measurement on the statistics display,
+        waits once and reads all the current values in one shot.
+
+        modes - list of measurement modes; each entry is either the
+        mode string as _measure() expects it (e.g. 'FREQuency') or a
+        (mode, para) tuple when the command needs parameters
+
+        channel - channel to be measured starting at 1. Must be a
+        string, ie. '1'
+
+        wait - if not None, number of seconds to wait before querying
+        the results
+
+        Returns a dictionary mapping each mode string to its current
+        value as a float, or an empty dictionary if the response could
+        not be parsed.
+        """
+
+        self._setScalarChannel(channel, 'MEASURE')
+
+        # Switch the measurement source if needed (see _measure())
+        if (self._lastMeasSrc is None):
+            self._lastMeasSrc = str(self._chanNumber(self._instQuery("MEASure:SOURce?")))
+        if (self._lastMeasSrc != self.channel):
+            self._instWrite("MEASure:SOURce {}".format(self.channelStr(self.channel)))
+            self._lastMeasSrc = self.channel
+
+        # Start from a clean statistics display so RESults? returns
+        # exactly the measurements requested here, in order
+        self._instWrite("MEASure:CLEar")
+        if (self._version > self._versionLegacy):
+            self._instWrite("MEASure:STATistics ON")
+        else:
+            self._instWrite("MEASure:STATistics:DISPlay ON")
+
+        # Install each measurement with the command form
+        modeNames = []
+        for entry in modes:
+            (mode, para) = entry if isinstance(entry, tuple) else (entry, None)
+            modeNames.append(mode)
+            if (para):
+                self._instWrite("MEASure:{} {}".format(mode, para))
+            else:
+                self._instWrite("MEASure:{}".format(mode))
+
+        # wait once before reading all values, if wait is not None
+        if (wait):
+            sleep(wait)
+
+        # RESults? returns label,current,min,max,mean,stddev,count per
+        # installed measurement, all comma-separated
+        statFlat = self._instQuery("MEASure:RESults?").split(',')
+
+        cols = 7
+        if (len(statFlat) != cols * len(modeNames)):
+            print('Unexpected response. Oscilloscope may not have accepted all measurements.')
+            return {}
+
+        # current value is the second column of each row
+        return {mode: float(statFlat[(row * cols) + 1])
+                for (row, mode) in enumerate(modeNames)}
+
+
     def measureBitRate(self, channel=None, wait=0.25, install=False):
         """Measure and return the bit rate measurement.
 
@@ -1154,7 +1705,7 @@ class Keysight(Oscilloscope):
         else:
             return self._measure("DUTYcycle", channel=channel, wait=wait, install=install)
 
-    def measureFallTime(self, channel=None, wait=0.25, install=False):
+    measureFallTime = _makeMeasure('measureFallTime', "FALLtime", None,
         """Measure and return the fall time
 
         This measurement is defined as: 'the fall time of the displayed
@@ -1165,21 +1716,9 @@ class Keysight(Oscilloscope):
         fall time with the following formula:
 
         fall time = time at lower threshold - time at upper threshold'
+        """)
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("FALLtime", channel=channel, wait=wait, install=install)
-
-    def measureRiseTime(self, channel=None, wait=0.25, install=False):
+    measureRiseTime = _makeMeasure('measureRiseTime', "RISetime", None,
         """Measure and return the rise time
 
         This measurement is defined as: 'the rise time of the displayed
@@ -1192,38 +1731,14 @@ class Keysight(Oscilloscope):
         calculating the rise time with the following formula:
 
         rise time = time at upper threshold - time at lower threshold'
+        """)
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("RISetime", channel=channel, wait=wait, install=install)
-
-    def measureFrequency(self, channel=None, wait=0.25, install=False):
+    measureFrequency = _makeMeasure('measureFrequency', "FREQ", None,
         """Measure and return the frequency of cycle on screen
 
         This measurement is defined as: 'the frequency of the cycle on
         the screen closest to the trigger reference.'
-
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("FREQ", channel=channel, wait=wait, install=install)
+        """)
 
     def measureNegDutyCycle(self, channel=None, wait=0.25, install=False):
         """Measure and return the negative duty cycle
@@ -1280,26 +1795,14 @@ class Keysight(Oscilloscope):
         else:
             return self._measure("NEDGes", channel=channel, wait=wait, install=install)
 
-    def measureFallPulseCount(self, channel=None, wait=0.25, install=False):
+    measureFallPulseCount = _makeMeasure('measureFallPulseCount', "NPULses", None,
         """Measure and return the on-screen falling pulse count
 
         This measurement is defined as: 'the on-screen falling pulse
         count'
+        """)
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("NPULses", channel=channel, wait=wait, install=install)
-
-    def measureNegPulseWidth(self, channel=None, wait=0.25, install=False):
+    measureNegPulseWidth = _makeMeasure('measureNegPulseWidth', "NWIDth", None,
         """Measure and return the on-screen falling/negative pulse width
 
         This measurement is defined as: 'the width of the negative pulse
@@ -1309,21 +1812,9 @@ class Keysight(Oscilloscope):
         FOR the negative pulse closest to the trigger point:
 
         width = (time at trailing rising edge - time at leading falling edge)'
+        """)
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("NWIDth", channel=channel, wait=wait, install=install)
-
-    def measureOvershoot(self, channel=None, wait=0.25, install=False):
+    measureOvershoot = _makeMeasure('measureOvershoot', "OVERshoot", None,
         """Measure and return the on-screen voltage overshoot in percent
 
         This measurement is defined as: 'the overshoot of the edge
@@ -1348,21 +1839,9 @@ class Keysight(Oscilloscope):
         signal may have more preshoot than overshoot, and the normal
         extremum would then be dominated by the preshoot of the
         following edge.'
+        """)
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("OVERshoot", channel=channel, wait=wait, install=install)
-
-    def measurePreshoot(self, channel=None, wait=0.25, install=False):
+    measurePreshoot = _makeMeasure('measurePreshoot', "PREShoot", None,
         """Measure and return the on-screen voltage preshoot in percent
 
         This measurement is defined as: 'the preshoot of the edge
@@ -1387,19 +1866,7 @@ class Keysight(Oscilloscope):
         signal may have more overshoot than preshoot, and the normal
         extremum would then be dominated by the overshoot of the
         preceding edge.'
-
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("PREShoot", channel=channel, wait=wait, install=install)
+        """)
 
     def measureRiseEdgeCount(self, channel=None, wait=0.25, install=False):
         """Measure and return the on-screen rising edge count
@@ -1424,26 +1891,14 @@ class Keysight(Oscilloscope):
         else:
             return self._measure("PEDGes", channel=channel, wait=wait, install=install)
 
-    def measureRisePulseCount(self, channel=None, wait=0.25, install=False):
+    measureRisePulseCount = _makeMeasure('measureRisePulseCount', "PPULses", None,
         """Measure and return the on-screen rising pulse count
 
         This measurement is defined as: 'the on-screen rising pulse
         count'
+        """)
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("PPULses", channel=channel, wait=wait, install=install)
-
-    def measurePosPulseWidth(self, channel=None, wait=0.25, install=False):
+    measurePosPulseWidth = _makeMeasure('measurePosPulseWidth', "PWIDth", None,
         """Measure and return the on-screen falling/positive pulse width
 
         This measurement is defined as: 'the width of the displayed
@@ -1455,21 +1910,9 @@ class Keysight(Oscilloscope):
         THEN width = (time at trailing falling edge - time at leading rising edge)
 
         ELSE width = (time at leading falling edge - time at leading rising edge)'
+        """)
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("PWIDth", channel=channel, wait=wait, install=install)
-
-    def measurePeriod(self, channel=None, wait=0.25, install=False):
+    measurePeriod = _makeMeasure('measurePeriod', "PERiod", None,
         """Measure and return the on-screen period
 
         This measurement is defined as: 'the period of the cycle closest
@@ -1481,21 +1924,9 @@ class Keysight(Oscilloscope):
         THEN period = (time at trailing rising edge - time at leading rising edge)
 
         ELSE period = (time at trailing falling edge - time at leading falling edge)'
+        """)
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("PERiod", channel=channel, wait=wait, install=install)
-
-    def measureVoltAmplitude(self, channel=None, wait=0.25, install=False):
+    measureVoltAmplitude = _makeMeasure('measureVoltAmplitude', "VAMPlitude", None,
         """Measure and return the vertical amplitude of the signal
 
         This measurement is defined as: 'the vertical amplitude of the
@@ -1503,41 +1934,17 @@ class Keysight(Oscilloscope):
         Vtop and Vbase, then calculates the amplitude as follows:
 
         vertical amplitude = Vtop - Vbase'
+        """)
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("VAMPlitude", channel=channel, wait=wait, install=install)
-
-    def measureVoltAverage(self, channel=None, wait=0.25, install=False):
+    measureVoltAverage = _makeMeasure('measureVoltAverage', "VAVerage", 'DISPlay',
         """Measure and return the Average Voltage measurement.
 
         This measurement is defined as: 'average value of an integral
         number of periods of the signal. If at least three edges are not
         present, the oscilloscope averages all data points.'
+        """)
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("VAVerage", para="DISPlay", channel=channel, wait=wait, install=install)
-
-    def measureVoltRMS(self, channel=None, wait=0.25, install=False):
+    measureVoltRMS = _makeMeasure('measureVoltRMS', "VRMS", 'DISPlay,DC',
         """Measure and return the DC RMS Voltage measurement.
 
         This measurement is defined as: 'the dc RMS value of the
@@ -1545,101 +1952,41 @@ class Keysight(Oscilloscope):
         number of periods of the displayed signal. If at least three
         edges are not present, the oscilloscope computes the RMS value
         on all displayed data points.'
+        """)
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("VRMS", para="DISPlay,DC", channel=channel, wait=wait, install=install)
-
-    def measureVoltBase(self, channel=None, wait=0.25, install=False):
+    measureVoltBase = _makeMeasure('measureVoltBase', "VBASe", None,
         """Measure and return the Voltage base measurement.
 
         This measurement is defined as: 'the vertical value at the base
         of the waveform. The base value of a pulse is normally not the
         same as the minimum value.'
+        """)
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("VBASe", channel=channel, wait=wait, install=install)
-
-    def measureVoltTop(self, channel=None, wait=0.25, install=False):
+    measureVoltTop = _makeMeasure('measureVoltTop', "VTOP", None,
         """Measure and return the Voltage Top measurement.
 
         This measurement is defined as: 'the vertical value at the top
         of the waveform. The top value of the pulse is normally not the
         same as the maximum value.'
+        """)
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("VTOP", channel=channel, wait=wait, install=install)
-
-    def measureVoltMax(self, channel=None, wait=0.25, install=False):
+    measureVoltMax = _makeMeasure('measureVoltMax', "VMAX", None,
         """Measure and return the Maximum Voltage measurement.
 
         This measurement is defined as: 'the maximum vertical value
         present on the selected waveform.'
+        """)
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
 
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("VMAX", channel=channel, wait=wait, install=install)
-
-
-    def measureVoltMin(self, channel=None, wait=0.25, install=False):
+    measureVoltMin = _makeMeasure('measureVoltMin', "VMIN", None,
         """Measure and return the Minimum Voltage measurement.
 
         This measurement is defined as: 'the minimum vertical value
         present on the selected waveform.'
-
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
-
-        channel: channel, as string, to be measured - default channel
-        for future readings
-
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
-        """
-
-        return self._measure("VMIN", channel=channel, wait=wait, install=install)
+        """)
 
 
-    def measureVoltPP(self, channel=None, wait=0.25, install=False):
+    measureVoltPP = _makeMeasure('measureVoltPP', "VPP", None,
         """Measure and return the voltage peak-to-peak measurement.
 
         This measurement is defined as: 'the maximum and minimum
@@ -1652,79 +1999,205 @@ class Keysight(Oscilloscope):
 
         Vmax and Vmin are the vertical maximum and minimum values
         present on the selected source.'
+        """)
+
+    ## These are dictionaries of measurement labels with their units,
+    ## method to get the data from the scope, and the (mode, para)
+    ## query spec for batching with _measureBatch(). Three flat dicts
+    ## instead of one table of lists so every lookup is a single
+    ## dict.get() with no per-entry indexing. The spec is None for
+    ## measurements whose command depends on the firmware version or
+    ## needs extra setup - those always go through the bound method.
+    _measureUnits = {
+        'Bit Rate': 'Hz',
+        'Burst Width': 's',
+        'Counter Freq': 'Hz',
+        'Frequency': 'Hz',
+        'Period': 's',
+        'Duty': '%',
+        'Neg Duty': '%',
+        'Fall Time': 's',
+        'Rise Time': 's',
+        'Num Falling': '',
+        'Num Neg Pulses': '',
+        'Num Rising': '',
+        'Num Pos Pulses': '',
+        '- Width': 's',
+        '+ Width': 's',
+        'Overshoot': '%',
+        'Preshoot': '%',
+        'Amplitude': 'V',
+        'Top': 'V',
+        'Base': 'V',
+        'Maximum': 'V',
+        'Minimum': 'V',
+        'Pk-Pk': 'V',
+        'V p-p': 'V',
+        'Average - Full Screen': 'V',
+        'RMS - Full Screen': 'V',
+        }
 
-        If the returned value is >= self.OverRange, then no valid value
-        could be measured.
+    _measureFuncs = {
+        'Bit Rate': measureBitRate,
+        'Burst Width': measureBurstWidth,
+        'Counter Freq': measureCounterFrequency,
+        'Frequency': measureFrequency,
+        'Period': measurePeriod,
+        'Duty': measurePosDutyCycle,
+        'Neg Duty': measureNegDutyCycle,
+        'Fall Time': measureFallTime,
+        'Rise Time': measureRiseTime,
+        'Num Falling': measureFallEdgeCount,
+        'Num Neg Pulses': measureFallPulseCount,
+        'Num Rising': measureRiseEdgeCount,
+        'Num Pos Pulses': measureRisePulseCount,
+        '- Width': measureNegPulseWidth,
+        '+ Width': measurePosPulseWidth,
+        'Overshoot': measureOvershoot,
+        'Preshoot': measurePreshoot,
+        'Amplitude': measureVoltAmplitude,
+        'Top': measureVoltTop,
+        'Base': measureVoltBase,
+        'Maximum': measureVoltMax,
+        'Minimum': measureVoltMin,
+        'Pk-Pk': measureVoltPP,
+        'V p-p': measureVoltPP,
+        'Average - Full Screen': measureVoltAverage,
+        'RMS - Full Screen': measureVoltRMS,
+        }
+
+    _measureSpecs = {
+        'Frequency': ('FREQ', None),
+        'Period': ('PERiod', None),
+        'Fall Time': ('FALLtime', None),
+        'Rise Time': ('RISetime', None),
+        'Num Neg Pulses': ('NPULses', None),
+        'Num Pos Pulses': ('PPULses', None),
+        '- Width': ('NWIDth', None),
+        '+ Width': ('PWIDth', None),
+        'Overshoot': ('OVERshoot', None),
+        'Preshoot': ('PREShoot', None),
+        'Amplitude': ('VAMPlitude', None),
+        'Top': ('VTOP', None),
+        'Base': ('VBASe', None),
+        'Maximum': ('VMAX', None),
+        'Minimum': ('VMIN', None),
+        'Pk-Pk': ('VPP', None),
+        'V p-p': ('VPP', None),
+        'Average - Full Screen': ('VAVerage', 'DISPlay'),
+        'RMS - Full Screen': ('VRMS', 'DISPlay,DC'),
+        }
+
+    def measureTblUnits(self, meas):
+        """Return units for measurement 'meas'
+
+        meas: a string to be looked up in _measureUnits to determine its units
+        """
+
+        # Could not find meas so return blank string
+        return self._measureUnits.get(meas, '')
+
+    def _measureBatch(self, specs, channel=None):
+        """Query several measurements with a single compound SCPI command.
+
+        Each query is a full instrument round-trip, which dominates the
+        cost of gathering measurements over LAN/USB/GPIB. Joining them
+        with ';:' sends the whole batch as one write and reads all the
+        values back in one reply.
+
+        specs: list of (mode, para) tuples as _measure() expects them
 
         channel: channel, as string, to be measured - default channel
         for future readings
 
-        wait - if not None, number of seconds to wait before querying measurement
-
-        install - if True, adds measurement to the statistics display
+        Returns a list of floats in specs order.
         """
 
-        return self._measure("VPP", channel=channel, wait=wait, install=install)
-
-    ## This is a dictionary of measurement labels with their units and
-    ## method to get the data from the scope.
-    _measureTbl = {
-        'Bit Rate': ['Hz', measureBitRate],
-        'Burst Width': ['s', measureBurstWidth],
-        'Counter Freq': ['Hz', measureCounterFrequency],
-        'Frequency': ['Hz', measureFrequency],
-        'Period': ['s', measurePeriod],
-        'Duty': ['%', measurePosDutyCycle],
-        'Neg Duty': ['%', measureNegDutyCycle],
-        'Fall Time': ['s', measureFallTime],
-        'Rise Time': ['s', measureRiseTime],
-        'Num Falling': ['', measureFallEdgeCount],
-        'Num Neg Pulses': ['', measureFallPulseCount],
-        'Num Rising': ['', measureRiseEdgeCount],
-        'Num Pos Pulses': ['', measureRisePulseCount],
-        '- Width': ['s', measureNegPulseWidth],
-        '+ Width': ['s', measurePosPulseWidth],
-        'Overshoot': ['%', measureOvershoot],
-        'Preshoot': ['%', measurePreshoot],
-        'Amplitude': ['V', measureVoltAmplitude],
-        'Top': ['V', measureVoltTop],
-        'Base': ['V', measureVoltBase],
-        'Maximum': ['V', measureVoltMax],
-        'Minimum': ['V', measureVoltMin],
-        'Pk-Pk': ['V', measureVoltPP],
-        'V p-p': ['V', measureVoltPP],
-        'Average - Full Screen': ['V', measureVoltAverage],
-        'RMS - Full Screen': ['V', measureVoltRMS],
-        }
+        self._setScalarChannel(channel, 'MEASURE')
 
-    def measureTblUnits(self, meas):
-        """Return units for measurement 'meas'
+        # Switch the measurement source if needed (see _measure())
+        if (self._lastMeasSrc is None):
+            self._lastMeasSrc = str(self._chanNumber(self._instQuery("MEASure:SOURce?")))
+        if (self._lastMeasSrc != self.channel):
+            self._instWrite("MEASure:SOURce {}".format(self.channelStr(self.channel)))
+            self._lastMeasSrc = self.channel
+
+        # ';:' restarts each following query from the command tree root
+        # so every subquery is a complete MEASure command
+        queryStr = ';:'.join("MEASure:{}? {}".format(mode, para) if (para)
+                             else "MEASure:{}?".format(mode)
+                             for (mode, para) in specs)
+
+        # the reply values come back semicolon-separated, in query order
+        return [float(val) for val in self._instQuery(queryStr).split(';')]
+
+    def measureTblCallMany(self, measList, channel=None):
+        """Gather several measurements from _measureFuncs in one batch.
+
+        Measurements with a query spec in _measureSpecs are combined
+        into a single compound query via _measureBatch(); the rest fall
+        back to their bound methods one at a time.
+
+        measList: list of measurement names, as strings, to be looked
+        up in _measureFuncs
+
+        channel: channel, as string, to be measured - default channel
+        for future readings
 
-        meas: a string to be looked up in _measureTbl to determine its units
+        Returns a dictionary mapping each name to its value, with
+        self.OverRange for names not in _measureFuncs.
         """
 
-        try:
-            units = self._measureTbl[meas][0]
-        except KeyError:
-            # Could not find meas so return blank string
-            units = ''
+        batch = []
+        results = {}
+        for meas in measList:
+            func = self._measureFuncs.get(meas)
+            if (func is None):
+                # Could not find meas so return self.OverRange
+                results[meas] = self.OverRange
+            elif (meas in self._measureSpecs):
+                batch.append(meas)
+            else:
+                # command depends on firmware version or needs extra
+                # setup, so go through the bound method
+                results[meas] = func(self, channel)
 
-        return units
+        if (batch):
+            values = self._measureBatch([self._measureSpecs[meas] for meas in batch], channel)
+            results.update(zip(batch, values))
+
+        # hand the results back in measList order
+        return {meas: results[meas] for meas in measList}
 
     def measureTblCall(self, meas, channel=None):
         """Call function to gather measurement 'meas' for channel and return its value
 
-        meas: a string to be looked up in _measureTbl to determine its units
+        meas: a string to be looked up in _measureFuncs to determine
+        which measurement function to call
 
         channel: channel, as string, to be measured - default channel
         for future readings
         """
 
-        try:
-            value = self._measureTbl[meas][1](self, channel)
-        except KeyError:
-            # Could not find meas so return self.OverRange
-            value = self.OverRange
+        return self.measureTblCallMany([meas], channel)[meas]
+
+    async def measureTblCallAsync(self, meas, channel=None):
+        """Async variant of measureTblCall().
+
+        Runs the blocking VISA I/O in the default thread-pool executor
+        so measurements on independent instruments can be gathered
+        concurrently with asyncio.gather() - wall time becomes the
+        slowest round-trip instead of their sum. Calls into the same
+        instrument still serialize on its I/O lock (VISA sessions are
+        not concurrent), and instruments sharing one GPIB bus
+        serialize on the bus itself, so the win comes from fanning out
+        across LAN/USB-attached instruments.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.measureTblCall, meas, channel)
 
-        return value
+    async def measureTblCallManyAsync(self, measList, channel=None):
+        """Async variant of measureTblCallMany() - see measureTblCallAsync()."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.measureTblCallMany, measList, channel)
     
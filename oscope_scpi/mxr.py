@@ -26,20 +26,35 @@
 #  Control of Keysight MXR series Oscilloscopes with PyVISA
 #-------------------------------------------------------------------------------
 
-# For future Python3 compatibility:
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-
 import sys
 import os
 
+import numpy as np
+
 try:
     from .keysight import Keysight
 except Exception:
     sys.path.append(os.getcwd())
     from keysight import Keysight
 
+## Extra channel names the MXR Series accepts beyond the analog
+## channels, built once at import time instead of running several list
+## comprehensions per instance. DIFF/COMM exist per analog channel, so
+## they are sized for the largest (8-channel) model and sliced to the
+## actual channel count in __init__().
+##
+## NOTE: document says WMEM is 1-4 but my MXR scope has 8 memory slots
+##
+## NOTE: POD1 is for digital channels 0-7 or POD2 for digital
+## channels 8-15, PODALL is for all 16.
+_DIFF_CHANS = tuple('DIFF'+str(x) for x in range(1,9))
+_COMM_CHANS = tuple('COMM'+str(x) for x in range(1,9))
+_FIXED_CHANS = (tuple('FUNC'+str(x) for x in range(1,17)) +
+                ('HIST',) +
+                tuple('WMEM'+str(x) for x in range(1,9)) +
+                tuple('BUS'+str(x) for x in range(1,5)) +
+                ('POD1', 'POD2', 'PODALL'))
+
 class MXR(Keysight):
     """Basic class for controlling and accessing a Keysight MXR Series Oscilloscope"""
 
@@ -50,27 +65,15 @@ class MXR(Keysight):
         maxChannel - number of channels of this oscilloscope
         wait       - float that gives the default number of seconds to wait after sending each command
         """
-        super(MXR, self).__init__(resource, maxChannel, wait)
-
-        # Add Differential Channels
-        self._chanAllValidList += ['DIFF'+str(x) for x in range(1,self._max_chan+1)]
-        
-        # Add Common-Mode Channels
-        self._chanAllValidList += ['COMM'+str(x) for x in range(1,self._max_chan+1)]
-        
-        # Add Functions FUNCx (x is 1-16)
-        self._chanAllValidList += ['FUNC'+str(x) for x in range(1,17)]
-        
-        # Add HIST (Histogram) to list of ALL valid channel strings.
-        self._chanAllValidList += ['HIST']
+        super().__init__(resource, maxChannel, wait)
 
-        # Add Wave Memory (document says this is 1-4 but my MXR scope has 8 memory slots)
-        self._chanAllValidList += ['WMEM'+str(x) for x in range(1,9)]
-        
-        # Add digital BUSb (b is 1-4), POD1, POD2 and PODALL
-        # NOTE: POD1 is for digital channels 0-7 or POD2 for digital
-        # channels 8-15, PODALL is for all 16.
-        self._chanAllValidList += ['BUS'+str(x) for x in range(1,5)] + ['POD'+str(x) for x in range(1,3)] + ['PODALL']
+        # Add the Differential and Common-Mode Channels for the analog
+        # channels this model has, plus the fixed extra names
+        # (FUNCx/HIST/WMEMx/BUSb/PODx) - all precomputed at module
+        # import, so construction just slices and concatenates
+        self._chanAllValidList += (list(_DIFF_CHANS[:self._max_chan]) +
+                                   list(_COMM_CHANS[:self._max_chan]) +
+                                   list(_FIXED_CHANS))
 
         # Give the Series a name
         self._series = 'MXR'
@@ -82,26 +85,34 @@ class MXR(Keysight):
         from the code below.
         """
 
-        statFlat = super(MXR, self)._measureStatistics()
-        
-        # convert the flat list into a two-dimentional matrix with seven columns per row
+        statFlat = super()._measureStatistics()
+
+        # bail out right away on an empty response so the parser below
+        # never runs when polling a scope with no measurements enabled
+        if (not statFlat or statFlat == ['']):
+            return []
+
+        # the flat list holds seven columns per measurement
         cols = 7
         if ((len(statFlat) % cols != 0)):
             print('Unexpected response. Oscilloscope may not have any measurements enabled.')
-            statMat = []
-        else:
-            statMat = [statFlat[i:i+cols] for i in range(0,len(statFlat),cols)]
-        
-        # convert each row into a dictionary, while converting text strings into numbers
+            return []
+
+        # Let numpy convert all the numeric strings in one pass
+        # instead of calling float() on every cell
+        statMat = np.array(statFlat).reshape(-1, cols)
+        numbers = statMat[:,1:].astype(np.float64)
+
+        # convert each row into a dictionary
         stats = []
-        for stat in statMat:
-            stats.append({'label':stat[0],
-                          'CURR':float(stat[1]),     # Current Value
-                          'MIN':float(stat[2]),      # Minimum Value
-                          'MAX':float(stat[3]),      # Maximum Value
-                          'MEAN':float(stat[4]),     # Average/Mean Value
-                          'STDD':float(stat[5]),     # Standard Deviation
-                          'COUN':int(float(stat[6])) # Count of measurements
+        for (label, num) in zip(statMat[:,0], numbers):
+            stats.append({'label':label,
+                          'CURR':num[0],     # Current Value
+                          'MIN':num[1],      # Minimum Value
+                          'MAX':num[2],      # Maximum Value
+                          'MEAN':num[3],     # Average/Mean Value
+                          'STDD':num[4],     # Standard Deviation
+                          'COUN':int(num[5]) # Count of measurements
                           })
 
         # return the result in an array of dictionaries
@@ -118,7 +129,7 @@ class MXR(Keysight):
         #@@@#self._instWrite("AUToscale:PLACement STACk")
         self._instWrite("AUToscale:PLACement SEParate")
 
-        super(MXR, self).setupAutoscale(channel)
+        super().setupAutoscale(channel)
 
         
 class MXRxx8A(MXR):
@@ -132,7 +143,7 @@ class MXRxx8A(MXR):
         resource - resource string or VISA descriptor, like TCPIP0::172.16.2.13::INSTR
         wait     - float that gives the default number of seconds to wait after sending each command
         """
-        super(MXRxx8A, self).__init__(resource, maxChannel=MXRxx8A.maxChannel, wait=wait)
+        super().__init__(resource, maxChannel=MXRxx8A.maxChannel, wait=wait)
 
 class MXRxx4A(MXR):
     """Child class of Keysight for controlling and accessing a Keysight MXRxx4A 4-Channel Oscilloscope"""
@@ -145,6 +156,6 @@ class MXRxx4A(MXR):
         resource - resource string or VISA descriptor, like TCPIP0::172.16.2.13::INSTR
         wait     - float that gives the default number of seconds to wait after sending each command
         """
-        super(MXRxx4A, self).__init__(resource, maxChannel=MXRxx4A.maxChannel, wait=wait)
+        super().__init__(resource, maxChannel=MXRxx4A.maxChannel, wait=wait)
 
 
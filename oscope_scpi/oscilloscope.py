@@ -31,11 +31,6 @@
 #  package in the future if find that not to be true.
 #-------------------------------------------------------------------------------
 
-# For future Python3 compatibility:
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-
 import sys
 import os
 
@@ -48,6 +43,7 @@ except Exception:
 from quantiphy import Quantity
 import numpy as np
 import csv
+import zipfile
 
 class Oscilloscope(SCPI):
     """Base class for controlling and accessing an Oscilloscope with PyVISA and SCPI commands"""
@@ -97,6 +93,20 @@ class Oscilloscope(SCPI):
     def chanAllValidList(self):
         return self._chanAllValidList
 
+    @property
+    def chanAllValidSet(self):
+        """frozenset of chanAllValidList for O(1) membership checks.
+
+        Built lazily and rebuilt if the list has grown since child
+        class __init__() methods extend _chanAllValidList after this
+        base class runs.
+        """
+        chanSet = getattr(self, '_chanAllValidSet', None)
+        if (chanSet is None or len(chanSet) != len(self._chanAllValidList)):
+            chanSet = frozenset(self._chanAllValidList)
+            self._chanAllValidSet = chanSet
+        return chanSet
+
     @property
     def series(self):
         # Use this so can branch activities based on oscilloscope series name
@@ -247,10 +257,11 @@ class Oscilloscope(SCPI):
 
         oscopeSetup = self._instQueryIEEEBlock("SYSTem:SETup?")
 
-        # Save setup to file.
-        f = open(filename, "wb")
-        f.write(oscopeSetup)
-        f.close()
+        # Save setup to file. Write through an unbuffered handle and a
+        # memoryview so the block goes to disk in one write with no
+        # intermediate stdio buffering or copy.
+        with open(filename, "wb", buffering=0) as f:
+            f.write(memoryview(oscopeSetup))
 
         #print('Oscilloscope Setup bytes saved: {} to "{}"'.format(len(oscopeSetup),filename))
 
@@ -265,9 +276,8 @@ class Oscilloscope(SCPI):
         """ Restore the oscilloscope setup from file with given filename. """
 
         # Load setup from file.
-        f = open(filename, "rb")
-        oscopeSetup = f.read()
-        f.close()
+        with open(filename, "rb") as f:
+            oscopeSetup = f.read()
 
         #print('Oscilloscope Setup bytes loaded: {} from "{}"'.format(len(oscopeSetup),filename))
 
@@ -284,7 +294,7 @@ class Oscilloscope(SCPI):
 
     
     def waveform(self, filename, channel=None, points=None):
-        """Download waveform data of a selected channel into a csv file.
+        """Download waveform data of a selected channel into a file.
 
         NOTE: This is a LEGACY function to prevent breaking API but it
         is deprecated so use above waveform functions instead.
@@ -296,7 +306,9 @@ class Oscilloscope(SCPI):
         load and are only useful from a scripting system like Python
         or MATLAB or Root. See waveformSaveNPZ() for a better option.
 
-        filename - base filename to store the data
+        filename - base filename to store the data - a .npz or .npy
+                   extension selects the much faster binary formats,
+                   anything else saves csv as before
 
         channel  - channel, as string, to be measured - set to None to use the default channel
 
@@ -308,6 +320,12 @@ class Oscilloscope(SCPI):
         # Acquire the data (also sets self.channel)
         (x, y, header, meta) = self.waveformData(channel, points)
 
+        # Pick the save format from the filename extension
+        if (filename.endswith('.npz')):
+            return self.waveformSaveNPZ(filename, x, y, header, meta)
+        elif (filename.endswith('.npy')):
+            return self.waveformSaveNPY(filename, x, y, header, meta)
+
         # Save to CSV file
         return self.waveformSaveCSV(filename, x, y, header)
     
@@ -329,7 +347,26 @@ class Oscilloscope(SCPI):
         nLength = len(x)
 
         print('Writing data to CSV file. Please wait...')
-        
+
+        # Fast path for the common single-trace case: hand the whole
+        # thing to np.savetxt which formats rows in C instead of going
+        # through the csv module row by row.
+        if (isinstance(x, np.ndarray) and isinstance(y, np.ndarray) and y.ndim == 1):
+            with open(filename, 'w', buffering=1024*1024) as myFile:
+                if header is not None:
+                    myFile.write(','.join('"{}"'.format(h) for h in header) + '\n')
+                np.savetxt(myFile, np.column_stack((x, y)), fmt='%.9g', delimiter=',')
+            return nLength
+
+        # Convert numpy arrays to plain Python lists up front -
+        # iterating a numpy array yields numpy scalar objects which
+        # the csv module formats much more slowly than native floats,
+        # and tolist() does the whole conversion in C.
+        if (isinstance(x, np.ndarray)):
+            x = x.tolist()
+        if (isinstance(y, np.ndarray)):
+            y = y.tolist()
+
         # Save waveform data values to CSV file.
         # Determine iterator
         if (isinstance(y[0],list)):
@@ -338,11 +375,12 @@ class Oscilloscope(SCPI):
         else:
             # Simply single column of y data
             it = zip(x,y)
-            
+
         # Open file for output. Only output x & y for simplicity. User
         # will have to copy paste the meta data printed to the
-        # terminal
-        myFile = open(filename, 'w')
+        # terminal. Use a large write buffer so the many small
+        # writerows() writes coalesce into few syscalls.
+        myFile = open(filename, 'w', buffering=1024*1024)
         with myFile:
             writer = csv.writer(myFile, dialect='excel', quoting=csv.QUOTE_NONNUMERIC)
             if header is not None:
@@ -354,7 +392,7 @@ class Oscilloscope(SCPI):
         return nLength
 
     
-    def waveformSaveNPZ(self, filename, x, y, header=None, meta=None):
+    def waveformSaveNPZ(self, filename, x, y, header=None, meta=None, dtype=None, compress=False):
         """
         filename - base filename to store the data
 
@@ -366,6 +404,16 @@ class Oscilloscope(SCPI):
 
         meta     - a list of meta data for waveform data
 
+        dtype    - optional numpy dtype, like 'float32' or 'float16', to cast
+                   the y data to before saving - roughly halves or quarters
+                   the file size at the cost of precision. The original dtype
+                   is recorded in the meta data. Default of None saves y
+                   unchanged.
+
+        compress - if True, deflate-compress the arrays (like np.savez_compressed).
+                   Smaller files but slower to write; default of False favors
+                   write speed.
+
         A NPZ file is an uncompressed zip file of the arrays x, y and optionally header and meta if supplied. 
         To load and use the data from python:
 
@@ -386,22 +434,92 @@ class Oscilloscope(SCPI):
 
         print('Writing data to Numpy NPZ file. Please wait...')
 
+        if (dtype is not None):
+            # Cast y down to the requested precision and note the
+            # original dtype in the meta data so a reader can tell the
+            # data was reduced.
+            y = np.asanyarray(y)
+            if (meta is not None):
+                meta = list(meta) + [('Original y dtype', str(y.dtype))]
+            y = y.astype(dtype, copy=False)
+
         arrays = {'x': x, 'y': y}
         if (header is not None):
             arrays['header']=header
         if (meta is not None):
             arrays['meta']=meta
-        np.savez(filename, **arrays)
-        
+
+        # Stream each array straight into the zip archive instead of
+        # using np.savez(), which serializes every array to a
+        # temporary buffer before copying it into the archive. This
+        # avoids holding a second copy of the waveform data in memory.
+        if not filename.endswith('.npz'):
+            filename += '.npz'
+        compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        with zipfile.ZipFile(filename, mode='w', compression=compression,
+                                 allowZip64=True) as zf:
+            for name, arr in arrays.items():
+                with zf.open(name + '.npy', 'w', force_zip64=True) as f:
+                    np.lib.format.write_array(f, np.asanyarray(arr), allow_pickle=False)
+
         # return number of entries written
         return nLength
 
     
-    ## This is a dictionary of measurement labels with their units. It
-    ## is blank here and it is expected that this get defined by child
-    ## classes.
-    _measureTbl = { }
-    
+    def waveformSaveNPY(self, filename, x, y, header=None, meta=None):
+        """
+        filename - base filename to store the data
+
+        x        - time data to write in first column
+
+        y        - vertical data: expected to be a list of columns to write and can be any number of columns
+
+        header   - a list of header strings - NOT stored since a NPY file holds a single array - only here to be like other waveformSave functions
+
+        meta     - a list of meta data for waveform data - NOT stored for same reason as header
+
+        A NPY file holds a single 2-D array with x in column 0 and the
+        y column(s) after it. The array is written through a memory
+        map so the columns are copied straight into the file and never
+        stacked into a second in-memory array first, which matters for
+        deep captures. Use waveformSaveNPZ() if header/meta need to be
+        stored with the data. To load and use the data from python:
+
+        import numpy as np
+        data = np.load(filename)
+        x = data[:,0]
+        y = data[:,1]
+
+        """
+
+        nLength = len(x)
+
+        print('Writing data to Numpy NPY file. Please wait...')
+
+        if not filename.endswith('.npy'):
+            filename += '.npy'
+
+        x = np.asanyarray(x)
+        yCols = np.atleast_2d(np.asanyarray(y))   # (ncols, npoints), even for 1-D y
+
+        mm = np.lib.format.open_memmap(filename, mode='w+',
+                                       dtype=np.result_type(x, yCols),
+                                       shape=(nLength, 1 + yCols.shape[0]))
+        mm[:,0] = x
+        mm[:,1:] = yCols.T
+        mm.flush()
+        del mm
+
+        # return number of entries written
+        return nLength
+
+
+    ## These are dictionaries of measurement labels with their units
+    ## and measurement functions. They are blank here and it is
+    ## expected that these get defined by child classes.
+    _measureUnits = { }
+    _measureFuncs = { }
+
 
     def polish(self, value, measure=None):
         """ Using the QuantiPhy package, return a value that is in apparopriate Si units.
@@ -415,9 +533,10 @@ class Oscilloscope(SCPI):
         if (value >= self.OverRange):
             pol = '------'
         else:
-            try:
-                pol = Quantity(value, self._measureTbl[measure][0])
-            except KeyError:
+            units = self._measureUnits.get(measure)
+            if (units is not None):
+                pol = Quantity(value, units)
+            else:
                 # If measure is None or does not exist
                 pol = Quantity(value)
 
@@ -519,10 +638,11 @@ if __name__ == '__main__':
             # use a blank string to put in an extra line
             print()
         else:
-            # using instr.measureTbl[] dictionary, call the
+            # using instr's _measureFuncs dictionary, call the
             # appropriate method to read the measurement. Also, using
             # the same measurement name, pass it to the polish() method
-            # to format the data with units and SI suffix.
+            # to format the data with units (from _measureUnits) and SI
+            # suffix.
             print('{: <24} {:>12.6}'.format(meas,instr.polish(instr.measureTblCall(meas), meas)))
 
     # turn off the channel
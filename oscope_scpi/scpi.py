@@ -31,16 +31,27 @@
 # http://www.ivifoundation.org/docs/scpi-99.pdf
 #-------------------------------------------------------------------------------
 
-# For future Python3 compatibility:
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-
 from time import sleep
-from sys import version_info
 from sys import exit
+from functools import wraps
+import threading
+import numpy as np
 import pyvisa as visa
 
+def _locked(func):
+    """Serialize instrument I/O through the per-instance lock.
+
+    VISA sessions are not thread-safe, and the async measurement
+    helpers run these methods from worker threads. The lock is
+    reentrant because error checking issues its own queries from
+    inside a locked call.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self._ioLock:
+            return func(self, *args, **kwargs)
+    return wrapper
+
 class SCPI(object):
     """Basic class for controlling and accessing an Oscilloscope with Standard SCPI Commands"""
 
@@ -79,6 +90,8 @@ class SCPI(object):
         self._version = 0.0     # set software version to lowest value until it gets set
         self._versionLegacy = 0.0   # set software version which triggers Legacy code to lowest value until it gets set
         self._legacyError = True    # Start off using Legacy Error method since both old and new instruments return something
+        self._chanStrCache = {}  # memoized channelStr() results - called on every measurement
+        self._ioLock = threading.RLock()  # serializes instrument I/O - see _locked()
         self._inst = None
 
     def open(self):
@@ -89,6 +102,20 @@ class SCPI(object):
                                             write_termination=self._write_termination)
         self._inst.timeout = self._timeout
 
+        # For TCPIP connections, disable Nagle's algorithm so every
+        # small SCPI write goes on the wire immediately instead of
+        # waiting to be coalesced with the next one - otherwise each
+        # short command/query can eat tens of ms of TCP delay. Not all
+        # backends/resources support the attribute, so failure is
+        # simply ignored.
+        if (self._inst.interface_type == visa.constants.InterfaceType.tcpip):
+            try:
+                self._inst.set_visa_attribute(
+                    visa.constants.ResourceAttribute.tcpip_nodelay,
+                    visa.constants.VI_TRUE)
+            except Exception:
+                pass
+
         # Keysight recommends using clear()
         #
         # NOTE: must use pyvisa-py >= 0.5.0 to get this implementation
@@ -127,6 +154,7 @@ class SCPI(object):
     def channel(self, value):
         self._curr_chan = value
 
+    @_locked
     def _instQuery(self, queryStr, checkErrors=True):
         if (queryStr[0] != '*'):
             queryStr = self._prefix + queryStr
@@ -149,7 +177,14 @@ class SCPI(object):
     def _instQueryNumber(self, queryStr, checkErrors=True):
         return float(self._instQuery(queryStr, checkErrors))
 
+    @_locked
     def _instWrite(self, writeStr, checkErrors=True):
+        if (not isinstance(writeStr, str)):
+            # A list/tuple of commands - chain them into one compound
+            # write so they cost a single round-trip. ';:' resets the
+            # command tree between them so each behaves like a
+            # standalone write.
+            writeStr = ';:'.join(writeStr)
         if (writeStr[0] != '*'):
             writeStr = self._prefix + writeStr
         #@@@print("WRITE:",writeStr)
@@ -181,13 +216,23 @@ class SCPI(object):
     def channelStr(self, channel):
         """return the channel string given the channel number and using the format CHANnelx if x is numeric. If pass in None, return None."""
 
+        # This sits on the hot path of every measurement, so memoize
+        # the formatted string per channel value
         try:
-            return 'CHAN{}'.format(int(channel))
+            return self._chanStrCache[channel]
+        except KeyError:
+            pass
+
+        try:
+            chanStr = 'CHAN{}'.format(int(channel))
         except TypeError:
             # If channel is None, will get this exception so simply return it
             return channel
         except ValueError:
-            return self._chanStr(channel)
+            chanStr = self._chanStr(channel)
+
+        self._chanStrCache[channel] = chanStr
+        return chanStr
 
     def _onORoff(self, str):
         """Check if string says it is ON or OFF and return True if ON
@@ -316,12 +361,13 @@ class SCPI(object):
     # Based on do_query_ieee_block() from the MSO-X 3000 Programming
     # Guide and modified to work within this class ...
     # =========================================================
-    def _instQueryIEEEBlock(self, queryStr, checkErrors=True):
+    @_locked
+    def _instQueryIEEEBlock(self, queryStr, checkErrors=True, chunk_size=None):
         if (queryStr[0] != '*'):
             queryStr = self._prefix + queryStr
         #print("QUERYIEEEBlock:",queryStr)
         try:
-            result = self._inst.query_binary_values(queryStr, datatype='s', container=bytes)
+            result = self._inst.query_binary_values(queryStr, datatype='s', container=bytes, chunk_size=chunk_size)
         except visa.VisaIOError as err:
             # Got VISA exception so read and report any errors
             if checkErrors:
@@ -333,10 +379,84 @@ class SCPI(object):
             self.checkInstErrors(queryStr)
         return result
 
+    @_locked
+    def _instQueryIEEEArray(self, queryStr, datatype, is_big_endian=False, checkErrors=True, chunk_size=None):
+        """Query an IEEE 488.2 binary block and decode it straight into a
+        numpy array.
+
+        datatype - single character struct-module element code, like
+        'b'/'h' for int8/int16 or 'f' for float32
+
+        PyVISA parses the block header and fills the array in one step,
+        so the payload is copied once instead of landing in an
+        intermediate bytes object that then gets decoded separately.
+        """
+        if (queryStr[0] != '*'):
+            queryStr = self._prefix + queryStr
+        #print("QUERYIEEEArray:",queryStr)
+        try:
+            result = self._inst.query_binary_values(queryStr, datatype=datatype,
+                                                    container=np.ndarray,
+                                                    is_big_endian=is_big_endian,
+                                                    header_fmt='ieee',
+                                                    chunk_size=chunk_size)
+        except visa.VisaIOError as err:
+            # Got VISA exception so read and report any errors
+            if checkErrors:
+                self.checkInstErrors(queryStr)
+            print("Exited because of VISA IO Error: {}".format(err))
+            exit(1)
+
+        if checkErrors:
+            self.checkInstErrors(queryStr)
+        return result
+
+    @_locked
+    def _instQueryIEEEBlockToFile(self, queryStr, f, checkErrors=True):
+        """Query an IEEE 488.2 binary block and stream it to the open binary
+        file object f in chunks, instead of collecting the whole block
+        in memory first. Returns the number of data bytes written.
+        """
+        if (queryStr[0] != '*'):
+            queryStr = self._prefix + queryStr
+        #print("QUERYIEEEBlockToFile:",queryStr)
+        try:
+            self._inst.write(queryStr)
+
+            # Parse the '#<N><length>' block header
+            tok = self._inst.read_bytes(2)
+            if (tok[0:1] != b'#'):
+                raise visa.InvalidBinaryFormat('Block does not start with #')
+            nDigits = int(tok[1:2])
+            length = int(self._inst.read_bytes(nDigits))
+
+            # Stream the data to the file in chunk_size pieces
+            chunk = self._inst.chunk_size
+            remaining = length
+            while (remaining > 0):
+                data = self._inst.read_bytes(min(remaining, chunk))
+                f.write(data)
+                remaining -= len(data)
+
+            # Consume the termination character(s) following the block, if any
+            if (self._read_strip):
+                self._inst.read_bytes(len(self._read_strip))
+        except visa.VisaIOError as err:
+            # Got VISA exception so read and report any errors
+            if checkErrors:
+                self.checkInstErrors(queryStr)
+            print("Exited because of VISA IO Error: {}".format(err))
+            exit(1)
+
+        if checkErrors:
+            self.checkInstErrors(queryStr)
+        return length
+
     # =========================================================
     # Based on code from the MSO-X 3000 Programming
     # Guide and modified to work within this class ...
     # =========================================================
+    @_locked
     def _instQueryNumbers(self, queryStr, checkErrors=True):
         if (queryStr[0] != '*'):
             queryStr = self._prefix + queryStr
@@ -358,20 +478,14 @@ class SCPI(object):
     # Based on do_command_ieee_block() from the MSO-X 3000 Programming
     # Guide and modified to work within this class ...
     # =========================================================
+    @_locked
     def _instWriteIEEEBlock(self, writeStr, values, checkErrors=True):
         if (writeStr[0] != '*'):
             writeStr = self._prefix + writeStr
         #print("WRITE:",writeStr)
 
-        if (version_info < (3,)):
-            ## If PYTHON 2, must use datatype of 'c'
-            datatype = 'c'
-        else:
-            ## If PYTHON 2, must use datatype of 'B' to get the same result
-            datatype = 'B'
-
         try:
-            result = self._inst.write_binary_values(writeStr, values, datatype=datatype)
+            result = self._inst.write_binary_values(writeStr, values, datatype='B')
         except visa.VisaIOError as err:
             # Got VISA exception so read and report any errors
             if checkErrors:
@@ -383,6 +497,7 @@ class SCPI(object):
             self.checkInstErrors(writeStr)
         return result
 
+    @_locked
     def _instWriteIEEENumbers(self, writeStr, values, checkErrors=True):
         if (writeStr[0] != '*'):
             writeStr = self._prefix + writeStr
@@ -26,14 +26,11 @@
 #  Control of Keysight UXR series Oscilloscopes with PyVISA
 #-------------------------------------------------------------------------------
 
-# For future Python3 compatibility:
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-
 import sys
 import os
 
+import numpy as np
+
 try:
     from .keysight import Keysight
 except Exception:
@@ -71,7 +68,11 @@ class UXR(Keysight):
         self._chanAllValidList += ['WMEM'+str(x) for x in range(1,9)]
         
         # Give the Series a name
-        self._series = 'UXR'        
+        self._series = 'UXR'
+
+        # found that with UXR it helped to wait a little to make sure
+        # RUN/STOP/SINGLE mode switches happen
+        self._modeSettleWait = 0.1
 
     def measureStatistics(self):
         """Returns an array of dictionaries from the current statistics window.
@@ -86,20 +87,23 @@ class UXR(Keysight):
         cols = 7
         if ((len(statFlat) % cols != 0)):
             print('Unexpected response. Oscilloscope may not have any measurements enabled.')
-            statMat = []
-        else:
-            statMat = [statFlat[i:i+cols] for i in range(0,len(statFlat),cols)]
-        
-        # convert each row into a dictionary, while converting text strings into numbers
+            return []
+
+        # Let numpy convert all the numeric strings in one pass
+        # instead of calling float() on every cell
+        statMat = np.array(statFlat).reshape(-1, cols)
+        numbers = statMat[:,1:].astype(np.float64)
+
+        # convert each row into a dictionary
         stats = []
-        for stat in statMat:
-            stats.append({'label':stat[0],
-                          'CURR':float(stat[1]),     # Current Value
-                          'MIN':float(stat[2]),      # Minimum Value
-                          'MAX':float(stat[3]),      # Maximum Value
-                          'MEAN':float(stat[4]),     # Average/Mean Value
-                          'STDD':float(stat[5]),     # Standard Deviation
-                          'COUN':int(float(stat[6])) # Count of measurements
+        for (label, num) in zip(statMat[:,0], numbers):
+            stats.append({'label':label,
+                          'CURR':num[0],     # Current Value
+                          'MIN':num[1],      # Minimum Value
+                          'MAX':num[2],      # Maximum Value
+                          'MEAN':num[3],     # Average/Mean Value
+                          'STDD':num[4],     # Standard Deviation
+                          'COUN':int(num[5]) # Count of measurements
                           })
 
         # return the result in an array of dictionaries
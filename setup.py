@@ -39,7 +39,7 @@ setuptools.setup(name="oscope_scpi",
                      'numpy>=1.19.5; python_version>="3.8"',
                      'numpy==1.19.5; python_version<"3.8"'
                  ],
-                 python_requires='>=3.6',
+                 python_requires='>=3.7',
                  packages=setuptools.find_packages(),
                  include_package_data=True,
                  zip_safe=False